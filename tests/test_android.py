@@ -0,0 +1,94 @@
+#    Copyright 2024 ARM Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+# pylint: disable=R0201
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from unittest import TestCase
+
+from nose.tools import assert_equal, assert_is_none
+
+from wa.utils.android import LogcatParser, LogcatLogLevel
+
+
+class TestLogcatParser(TestCase):
+
+    def setUp(self):
+        self.parser = LogcatParser()
+
+    def test_parse_line(self):
+        event = self.parser.parse_line('01-28 00:48:49.123  1234  5678 I ActivityManager: Start proc',
+                                       2023)
+        assert_equal(event.timestamp, datetime(2023, 1, 28, 0, 48, 49, 123000))
+        assert_equal(event.pid, 1234)
+        assert_equal(event.tid, 5678)
+        assert_equal(event.level, LogcatLogLevel.info)
+        assert_equal(event.tag, 'ActivityManager')
+        assert_equal(event.message, 'Start proc')
+
+    def test_parse_line_default_year(self):
+        event = self.parser.parse_line('01-28 00:48:49.123 1 2 V Tag: message')
+        assert_equal(event.timestamp.year, datetime.now().year)
+
+    def test_parse_line_spaced_tag(self):
+        event = self.parser.parse_line('01-28 00:48:49.1 1 2 D My  Tag   : two  spaces', 2023)
+        assert_equal(event.timestamp, datetime(2023, 1, 28, 0, 48, 49, 100000))
+        assert_equal(event.level, LogcatLogLevel.debug)
+        assert_equal(event.tag, 'My  Tag')
+        assert_equal(event.message, 'two  spaces')
+
+        event = self.parser.parse_line('01-28 00:48:49.123 1 2 W : no tag', 2023)
+        assert_equal(event.tag, '')
+        assert_equal(event.message, 'no tag')
+
+    def test_parse_line_malformed(self):
+        assert_is_none(self.parser.parse_line('', 2023))
+        assert_is_none(self.parser.parse_line('--------- beginning of main', 2023))
+        assert_is_none(self.parser.parse_line('garbage line: here', 2023))
+        assert_is_none(self.parser.parse_line('01-28 00:48:49.123 abc 2 I Tag: bad pid', 2023))
+        assert_is_none(self.parser.parse_line('01-28 00:48:49.123 1 2 X Tag: bad level', 2023))
+        assert_is_none(self.parser.parse_line('13-01 00:48:49.123 1 2 I Tag: bad month', 2023))
+
+    def test_parse_line_year_boundary(self):
+        event = self.parser.parse_line('12-31 23:59:59.999 1 2 W Tag: end of year', 2023)
+        assert_equal(event.timestamp, datetime(2023, 12, 31, 23, 59, 59, 999000))
+        event = self.parser.parse_line('01-01 00:00:00.000 1 2 W Tag: start of year', 2024)
+        assert_equal(event.timestamp, datetime(2024, 1, 1, 0, 0, 0))
+
+        # 29th of February only exists in leap years
+        assert_is_none(self.parser.parse_line('02-29 10:00:00.000 1 2 E Tag: leap', 2023))
+        event = self.parser.parse_line('02-29 10:00:00.000 1 2 E Tag: leap', 2024)
+        assert_equal(event.timestamp, datetime(2024, 2, 29, 10, 0, 0))
+
+    def test_parse(self):
+        tempdir = tempfile.mkdtemp()
+        try:
+            filepath = os.path.join(tempdir, 'logcat.log')
+            with open(filepath, 'w') as wfh:
+                wfh.write('--------- beginning of main\n'
+                          '12-31 23:59:59.999 1 2 I Tag: first\n'
+                          'garbage line: here\n'
+                          '01-01 00:00:00.000 1 2 E Tag: second\n')
+            events = list(self.parser.parse(filepath))
+        finally:
+            shutil.rmtree(tempdir)
+
+        assert_equal([e.message for e in events], ['first', 'second'])
+        assert_equal([e.level for e in events], [LogcatLogLevel.info, LogcatLogLevel.error])
+        # logcat does not record the year, so every line is given the current one
+        assert_equal(set(e.timestamp.year for e in events), set([datetime.now().year]))
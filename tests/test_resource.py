@@ -0,0 +1,115 @@
+#    Copyright 2024 ARM Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+# pylint: disable=R0201
+import os
+import shutil
+import tempfile
+import weakref
+from unittest import TestCase
+
+from nose.tools import assert_equal, assert_is_none
+
+from wa.framework.resource import File, ResourceResolver, SourcePriority, NO_ONE
+
+
+class CountingSource(object):
+
+    def __init__(self, path):
+        self.path = path
+        self.calls = 0
+
+    def __call__(self, resource):
+        self.calls += 1
+        if resource.kind == 'file':
+            return self.path
+        return None
+
+
+class Owner(object):
+
+    name = 'owner'
+
+
+class AlwaysFetchGetter(object):
+
+    always_fetch = True
+
+
+class TestResourceResolverCache(TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tempdir, 'resource.txt')
+        with open(self.path, 'w') as wfh:
+            wfh.write('resource')
+        self.source = CountingSource(self.path)
+        self.resolver = ResourceResolver(loader=None)
+        self.resolver.register(self.source, SourcePriority.local)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_hit(self):
+        assert_equal(self.resolver.get(File(NO_ONE, 'resource.txt')), self.path)
+        assert_equal(self.resolver.get(File(NO_ONE, 'resource.txt')), self.path)
+        assert_equal(self.source.calls, 1)
+
+        # A resource with different fields is resolved separately
+        assert_equal(self.resolver.get(File(NO_ONE, 'other.txt')), self.path)
+        assert_equal(self.source.calls, 2)
+
+    def test_invalidated_by_register(self):
+        assert_equal(self.resolver.get(File(NO_ONE, 'resource.txt')), self.path)
+
+        other_path = os.path.join(self.tempdir, 'preferred.txt')
+        with open(other_path, 'w') as wfh:
+            wfh.write('preferred')
+        preferred = CountingSource(other_path)
+        self.resolver.register(preferred, SourcePriority.preferred)
+
+        assert_equal(self.resolver.get(File(NO_ONE, 'resource.txt')), other_path)
+        assert_equal(preferred.calls, 1)
+
+    def test_miss_when_cached_file_deleted(self):
+        assert_equal(self.resolver.get(File(NO_ONE, 'resource.txt')), self.path)
+        os.remove(self.path)
+
+        assert_equal(self.resolver.get(File(NO_ONE, 'resource.txt')), self.path)
+        assert_equal(self.source.calls, 2)
+
+    def test_not_cached_when_always_fetching(self):
+        self.resolver.getters.append(AlwaysFetchGetter())
+        assert_equal(self.resolver.get(File(NO_ONE, 'resource.txt')), self.path)
+        assert_equal(self.resolver.get(File(NO_ONE, 'resource.txt')), self.path)
+        assert_equal(self.source.calls, 2)
+
+    def test_invalidate(self):
+        assert_equal(self.resolver.get(File(NO_ONE, 'resource.txt')), self.path)
+        self.resolver.invalidate()
+        assert_equal(self.resolver.get(File(NO_ONE, 'resource.txt')), self.path)
+        assert_equal(self.source.calls, 2)
+
+    def test_owner_not_kept_alive(self):
+        owner = Owner()
+        owner_ref = weakref.ref(owner)
+        assert_equal(self.resolver.get(File(owner, 'resource.txt')), self.path)
+        del owner
+        assert_is_none(owner_ref())
+
+        # Another owner of the same name shares the resolved path
+        assert_equal(self.resolver.get(File(Owner(), 'resource.txt')), self.path)
+        assert_equal(self.source.calls, 1)
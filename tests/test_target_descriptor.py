@@ -0,0 +1,49 @@
+#    Copyright 2024 ARM Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+# pylint: disable=R0201
+import copy
+from unittest import TestCase
+
+from nose.tools import assert_equal, assert_is_not
+
+from wa.framework.plugin import Parameter
+from wa.framework.target.descriptor import TargetDescription
+
+
+class TestTargetDescription(TestCase):
+
+    def setUp(self):
+        self.td = TargetDescription('test_target', 'test_source',
+                                    target_params=[Parameter('a', default=1)],
+                                    platform_params=[Parameter('b', default=2)])
+
+    def test_copy(self):
+        assert_equal(self.td.get_default_config(), {'a': 1, 'b': 2})
+        td_copy = copy.copy(self.td)
+        assert_equal(td_copy.name, 'test_target')
+        assert_equal(td_copy.get_default_config(), {'a': 1, 'b': 2})
+
+        # Replacing the parameters of the copy must not affect the original
+        td_copy.target_params = [Parameter('c', default=3)]
+        assert_equal(td_copy.get_default_config(), {'c': 3, 'b': 2})
+        assert_equal(self.td.get_default_config(), {'a': 1, 'b': 2})
+
+    def test_deepcopy(self):
+        assert_equal(self.td.get_default_config(), {'a': 1, 'b': 2})
+        td_copy = copy.deepcopy(self.td)
+        assert_is_not(td_copy.target_params, self.td.target_params)
+        assert_equal(td_copy.get_default_config(), {'a': 1, 'b': 2})
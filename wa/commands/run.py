@@ -21,8 +21,6 @@ import shutil
 import wa
 from wa import Command, settings
 from wa.framework import pluginloader
-from wa.framework.configuration.parsers import AgendaParser
-from wa.framework.execution import Executor
 from wa.framework.output import init_run_output, RunOutput
 from wa.framework.exception import NotFoundError, ConfigError
 from wa.utils import log
@@ -92,22 +90,28 @@ class RunCommand(Command):
                                  """)
 
     def execute(self, config: 'ConfigManager', args: Namespace) -> None:  # pylint: disable=arguments-differ
+        # Only needed when a run is actually performed, not when the command
+        # is registered at start up.
+        # pylint: disable=import-outside-toplevel
+        from wa.framework.configuration.parsers import AgendaParser
+        from wa.framework.execution import Executor
+
         output: RunOutput = self.set_up_output_directory(config, args)
         log.add_file(output.logfile)
         output.add_artifact('runlog', output.logfile, kind='log',
                             description='Run log.')
 
-        disabled_augmentations = toggle_set([i != '~~' and "~{}".format(i) or i
-                                            for i in args.augmentations_to_disable])
+        disabled_augmentations = toggle_set(i if i == '~~' else f'~{i}'
+                                            for i in args.augmentations_to_disable)
         config.jobs_config.disable_augmentations(disabled_augmentations)
         config.jobs_config.only_run_ids(args.only_run_ids)
 
         parser = AgendaParser()
         if os.path.isfile(args.agenda):
             includes: List[str] = parser.load_from_path(config, args.agenda)
-            shutil.copy(args.agenda, output.raw_config_dir)
-            for inc in includes:
-                shutil.copy(inc, output.raw_config_dir)
+            _copy_to_dir(args.agenda, output.raw_config_dir)
+            for inc in dict.fromkeys(includes):
+                _copy_to_dir(inc, output.raw_config_dir)
         else:
             try:
                 cast('__LoaderWrapper', pluginloader).get_plugin_class(args.agenda, kind='workload')
@@ -147,3 +151,14 @@ class RunCommand(Command):
                 sys.exit(1)
             else:
                 raise e
+
+
+def _copy_to_dir(src: str, dest_dir: str) -> None:
+    """
+    Copy the contents of ``src`` into ``dest_dir``, keeping the file name.
+    Only the data is copied (``shutil.copyfile`` uses the platform's
+    zero-copy fast path where one exists); permission bits are not needed
+    for the raw config snapshot. Hard links are deliberately not used, as
+    later edits to the source must not alter the recorded run config.
+    """
+    shutil.copyfile(src, os.path.join(dest_dir, os.path.basename(src)))
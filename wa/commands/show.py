@@ -18,27 +18,29 @@
 #       long time. To avoid that, skip this file.
 # pylint: disable-all
 
+import os
 import sys
-from subprocess import call, Popen, PIPE
+import hashlib
+from subprocess import run, Popen, PIPE
 
-from devlib.utils.misc import escape_double_quotes
+from devlib.utils.misc import memoized
 
-from wa import Command
+from wa import Command, settings
 from wa.framework import pluginloader
-from wa.framework.configuration.core import MetaConfiguration, RunConfiguration
+from wa.framework.configuration.default import GLOBAL_CONFIG_POINTS
 from wa.framework.exception import NotFoundError
-from wa.framework.target.descriptor import list_target_descriptions, TargetDescriptionProtocol
+from wa.framework.target.descriptor import (list_target_descriptions, TargetDescriptionProtocol,
+                                           get_target_description as _get_target_description)
 from wa.utils.types import caseless_string, identifier
 from wa.utils.doc import (strip_inlined_text, get_rst_from_plugin,
                           get_params_rst, underline)
-from wa.utils.misc import which
-from typing import TYPE_CHECKING, cast, Optional, List, Type
+from wa.utils.misc import which, atomic_write_path
+from typing import TYPE_CHECKING, cast, Optional, Type, Dict, Tuple, Callable
 from argparse import Namespace
 if TYPE_CHECKING:
     from wa.framework.execution import ExecutionContext, ConfigManager
     from wa.framework.pluginloader import __LoaderWrapper
     from wa.framework.plugin import Plugin
-    from wa.framework.configuration.core import ConfigurationPoint
 
 
 class ShowCommand(Command):
@@ -65,13 +67,15 @@ class ShowCommand(Command):
             except NotFoundError:
                 plugin = None
             if plugin:
-                rst_output = get_rst_from_plugin(plugin)
+                rst_output = get_cached_rst(plugin.kind, plugin.name or '',
+                                            lambda: get_rst_from_plugin(plugin))
                 plugin_name = plugin.name or ''
                 kind = '{}:'.format(plugin.kind)
             else:
                 target: Optional[TargetDescriptionProtocol] = get_target_description(name)
                 if target:
-                    rst_output = get_rst_from_target(target)
+                    rst_output = get_cached_rst('target', target.name,
+                                                lambda: get_rst_from_target(target))
                     plugin_name = target.name
                     kind = 'target:'
 
@@ -79,34 +83,78 @@ class ShowCommand(Command):
             raise NotFoundError('Could not find plugin or alias "{}"'.format(name))
 
         if which('pandoc'):
-            p = Popen(['pandoc', '-f', 'rst', '-t', 'man'], stdin=PIPE, stdout=PIPE, stderr=PIPE)
-            output_, _ = p.communicate(rst_output.encode(sys.stdin.encoding))
-            output = output_.decode(sys.stdout.encoding)
-
-            # Make sure to double escape back slashes
-            output = output.replace('\\', '\\\\\\')
+            output = get_man_from_rst(rst_output)
 
             # Correctly format the title and page number of the man page
             title, body = output.split('\n', 1)
             title = '.TH {}{} 7'.format(kind, plugin_name)
             output = '\n'.join([title, body])
 
-            call('echo "{}" | man -l -'.format(escape_double_quotes(output)), shell=True)
+            run(['man', '-l', '-'], input=output.encode(sys.stdout.encoding))
         else:
             print(rst_output)  # pylint: disable=superfluous-parens
 
 
+def get_man_from_rst(rst_output: str) -> str:
+    """
+    convert restructured text into a man page using pandoc. The result is
+    cached in the WA cache directory, keyed on a hash of the input text, so
+    pandoc is only invoked the first time a given page is shown.
+    """
+    digest: str = hashlib.sha1(rst_output.encode('utf-8')).hexdigest()
+    cache_file: str = os.path.join(settings.cache_directory, 'show', '{}.man'.format(digest))
+    if os.path.isfile(cache_file):
+        with open(cache_file, encoding='utf-8') as fh:
+            return fh.read()
+
+    p = Popen(['pandoc', '-f', 'rst', '-t', 'man'], stdin=PIPE, stdout=PIPE, stderr=PIPE)
+    output_, _ = p.communicate(rst_output.encode(sys.stdin.encoding))
+    output: str = output_.decode(sys.stdout.encoding)
+    if p.returncode == 0:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with atomic_write_path(cache_file) as at_path:
+            with open(at_path, 'w', encoding='utf-8') as wfh:
+                wfh.write(output)
+    return output
+
+
 def get_target_description(name: str) -> Optional[TargetDescriptionProtocol]:
     """
     get target description
     """
-    targets = list_target_descriptions()
-    for target in targets:
+    try:
+        return _get_target_description(name)
+    except ValueError:
+        pass
+    # fall back to matching names that are not identifiers themselves
+    for target in list_target_descriptions():
         if name == identifier(target.name):
             return target
     return None
 
 
+# (kind, name) --> restructured text, for the plugin loader generation below
+_RST_CACHE: Dict[Tuple[str, str], str] = {}
+_rst_cache_generation: Optional[int] = None
+
+
+def get_cached_rst(kind: str, name: str, build: Callable[[], str]) -> str:
+    """
+    get restructured text for the plugin (or target) ``name`` of ``kind``,
+    calling ``build`` to generate it if it has not been generated since the
+    plugins were last loaded
+    """
+    global _rst_cache_generation
+    generation: int = cast('__LoaderWrapper', pluginloader).generation
+    if generation != _rst_cache_generation:
+        _RST_CACHE.clear()
+        _rst_cache_generation = generation
+    key: Tuple[str, str] = (kind, name)
+    if key not in _RST_CACHE:
+        _RST_CACHE[key] = build()
+    return _RST_CACHE[key]
+
+
 def get_rst_from_target(target: TargetDescriptionProtocol) -> str:
     """
     get restructured text from target description
@@ -124,6 +172,7 @@ def get_rst_from_target(target: TargetDescriptionProtocol) -> str:
     return text + '\n'
 
 
+@memoized
 def get_rst_for_global_config() -> str:
     """
     get restructured text for global configuration
@@ -134,8 +183,7 @@ def get_rst_for_global_config() -> str:
             '$WA_USER_DIRECTORY/config.yaml or one which is specified with -c), ' \
             'or into config/global section of the agenda.\n\n'
 
-    cfg_points: List['ConfigurationPoint'] = MetaConfiguration.config_points + RunConfiguration.config_points
-    text += get_params_rst(cfg_points)
+    text += get_params_rst(GLOBAL_CONFIG_POINTS)
     return text
 
 
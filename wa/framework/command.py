@@ -20,11 +20,15 @@ from wa.framework.plugin import Plugin
 from wa.framework.version import get_wa_version
 from wa.utils.doc import format_body
 from typing import Optional, List, Type, Dict, cast, Any, TYPE_CHECKING
-from argparse import ArgumentParser, _SubParsersAction, Namespace
+from argparse import ArgumentParser, _SubParsersAction, Namespace, Action, SUPPRESS
 import logging
 if TYPE_CHECKING:
     from wa.framework.execution import ExecutionContext, ConfigManager
 
+# init_argument_parser() is invoked for every (sub)command parser, so only
+# format the version string once.
+_WA_VERSION: str = get_wa_version()
+
 
 def init_argument_parser(parser: ArgumentParser):
     """
@@ -35,10 +39,28 @@ def init_argument_parser(parser: ArgumentParser):
     parser.add_argument('-v', '--verbose', action='count',
                         help='The scripts will produce verbose output.')
     parser.add_argument('--version', action='version',
-                        version='%(prog)s {}'.format(get_wa_version()))
+                        version='%(prog)s {}'.format(_WA_VERSION))
     return parser
 
 
+class _FormattedDescriptionHelpAction(Action):
+    """
+    ``-h``/``--help`` action that formats the parser's description only when
+    help is actually displayed, rather than for every command at start up.
+    """
+
+    def __init__(self, option_strings: List[str], dest: str = SUPPRESS,
+                 default: str = SUPPRESS, help: Optional[str] = None):  # pylint: disable=redefined-builtin
+        super(_FormattedDescriptionHelpAction, self).__init__(option_strings=option_strings, dest=dest,
+                                                              default=default, nargs=0, help=help)
+
+    def __call__(self, parser: ArgumentParser, namespace: Namespace,
+                 values: Any, option_string: Optional[str] = None) -> None:
+        parser.description = format_body(textwrap.dedent(parser.description or ''), 80)
+        parser.print_help()
+        parser.exit()
+
+
 class SubCommand(object):
     """
     Defines a Workload Automation command. This will be executed from the
@@ -58,12 +80,14 @@ class SubCommand(object):
     def __init__(self, logger: logging.Logger, subparsers: _SubParsersAction):
         self.logger = logger
         self.group = subparsers
-        desc = format_body(textwrap.dedent(self.description or ''), 80)
         parser_params: Dict[str, Any] = dict(help=(self.help or self.description), usage=self.usage,
-                                             description=desc, epilog=self.epilog)
+                                             description=self.description, epilog=self.epilog,
+                                             add_help=False)
         if self.formatter_class:
             parser_params['formatter_class'] = self.formatter_class
         self.parser: ArgumentParser = subparsers.add_parser(self.name or '', **parser_params)
+        self.parser.add_argument('-h', '--help', action=_FormattedDescriptionHelpAction,
+                                 help='show this help message and exit')
         init_argument_parser(self.parser)  # propagate top-level options
         self.initialize(None)
 
@@ -115,6 +139,7 @@ class ComplexCommand(Command):
 
     def __init__(self, subparsers: _SubParsersAction):
         self.subcommands: List[SubCommand] = []
+        self._subcmd_by_name: Dict[str, SubCommand] = {}
         super(ComplexCommand, self).__init__(subparsers)
 
     def initialize(self, context: Optional['ExecutionContext']) -> None:
@@ -123,11 +148,10 @@ class ComplexCommand(Command):
         for subcmd_cls in self.subcmd_classes:
             subcmd: SubCommand = subcmd_cls(self.logger, subparsers)
             self.subcommands.append(subcmd)
+            self._subcmd_by_name[subcmd.name or ''] = subcmd
 
     def execute(self, state: 'ConfigManager', args: Namespace) -> None:
-        for subcmd in self.subcommands:
-            if subcmd.name == args.what:
-                subcmd.execute(state, args)
-                break
-        else:
-            raise CommandError('Not a valid create parameter: {}'.format(args.name))
+        subcmd: Optional[SubCommand] = self._subcmd_by_name.get(args.what)
+        if subcmd is None:
+            raise CommandError('Not a valid create parameter: {}'.format(args.what))
+        subcmd.execute(state, args)
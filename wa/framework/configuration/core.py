@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import os
+import sys
 import logging
 from copy import copy, deepcopy
 from collections import OrderedDict, defaultdict
@@ -319,7 +320,8 @@ class ConfigurationPoint(object):
                            config should be ignored. If supplied WA will display
                            a warning to the user however will continue execution.
         """
-        self.name = identifier(name)
+        # interned, as names are used as keys in many parameter lookups
+        self.name = sys.intern(str(identifier(name)))
         kind = KIND_MAP.get(kind, kind) if kind else None
         if kind is not None and not callable(kind):
             raise ValueError('Kind must be callable.')
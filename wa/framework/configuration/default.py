@@ -13,13 +13,20 @@
 # limitations under the License.
 #
 
+from functools import lru_cache
+from io import StringIO
+
+from devlib.utils.misc import memoized
+from yaml import Dumper
+
+from wa.framework import pluginloader
 from wa.framework.configuration.core import MetaConfiguration, RunConfiguration
-from wa.framework.configuration.plugin_cache import PluginCache
 from wa.utils.serializer import yaml
 from wa.utils.doc import strip_inlined_text
-from typing import List, TYPE_CHECKING, TextIO, Optional, cast
+from typing import List, TYPE_CHECKING, TextIO, Optional, Dict, cast
 if TYPE_CHECKING:
     from wa.framework.configuration.core import ConfigurationPoint
+    from wa.framework.pluginloader import __LoaderWrapper
 
 DEFAULT_AUGMENTATIONS: List[str] = [
     'execution_time',
@@ -29,13 +36,26 @@ DEFAULT_AUGMENTATIONS: List[str] = [
     'csv',
 ]
 
+# Configuration points that make up the global (meta + run) config. These are
+# class-level definitions that do not change at runtime.
+GLOBAL_CONFIG_POINTS: List['ConfigurationPoint'] = (MetaConfiguration.config_points
+                                                    + RunConfiguration.config_points)
+
 
 def _format_yaml_comment(param: 'ConfigurationPoint', short_description=False) -> str:
     """
     format yaml comment
     """
-    comment: Optional[str] = param.description
-    comment = strip_inlined_text(comment or '')
+    return _format_description_comment(param.description, short_description)
+
+
+@lru_cache(maxsize=256)
+def _format_description_comment(description: Optional[str], short_description: bool) -> str:
+    """
+    format a description as a yaml comment; cached by value, as the same
+    descriptions are formatted repeatedly
+    """
+    comment = strip_inlined_text(description or '')
     if short_description:
         comment = comment.split('\n\n')[0] if comment else ''
     comment = comment.replace('\n', '\n# ') if comment else ''
@@ -47,24 +67,66 @@ def _format_augmentations(output: TextIO) -> None:
     """
     format augmentations
     """
-    plugin_cache = PluginCache()
-    output.write("augmentations:\n")
+    loader = cast('__LoaderWrapper', pluginloader)
+    parts: List[str] = ["augmentations:\n"]
     for plugin in DEFAULT_AUGMENTATIONS:
-        plugin_cls = plugin_cache.loader.get_plugin_class(plugin)
-        output.writelines(_format_yaml_comment(cast('ConfigurationPoint', plugin_cls), short_description=True))
-        output.write(" - {}\n".format(plugin))
-        output.write("\n")
+        plugin_cls = loader.get_plugin_class(plugin)
+        parts.append(_format_yaml_comment(cast('ConfigurationPoint', plugin_cls), short_description=True))
+        parts.append(" - {}\n\n".format(plugin))
+    output.write(''.join(parts))
 
 
 def generate_default_config(path: str) -> None:
     """
     generate default configuration
     """
-    with open(path, 'w') as output:
-        for param in MetaConfiguration.config_points + RunConfiguration.config_points:
-            entry = {param.name: param.default}
-            write_param_yaml(entry, param, output)
-        _format_augmentations(output)
+    with open(path, 'w', encoding='utf-8') as output:
+        output.write(_render_default_config())
+
+
+@memoized
+def _render_default_config() -> str:
+    """
+    Render the default configuration file contents. These are fully
+    determined by static configuration points and default augmentations, so
+    are only rendered once.
+    """
+    output = StringIO()
+    for param, text in zip(GLOBAL_CONFIG_POINTS, _dump_param_defaults(GLOBAL_CONFIG_POINTS)):
+        output.write(_format_yaml_comment(param))
+        output.write(text)
+        output.write("\n")
+    _format_augmentations(output)
+    return output.getvalue()
+
+
+class _NoAliasDumper(Dumper):  # pylint: disable=too-many-ancestors
+    """
+    YAML dumper that never emits anchors and aliases, so that the text for
+    each parameter stands on its own once the output is split up
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
+def _dump_param_defaults(params: List['ConfigurationPoint']) -> List[str]:
+    """
+    Serialize the defaults of all ``params`` in a single YAML emitter pass
+    and return the YAML text for each parameter, in the order of ``params``.
+    """
+    buf = StringIO()
+    yaml.dump({param.name: param.default for param in params}, buf,
+              Dumper=_NoAliasDumper, default_flow_style=False)
+    chunks: Dict[str, List[str]] = {}
+    current: List[str] = []
+    for line in buf.getvalue().splitlines(True):
+        # Top-level keys are the only non-blank lines that start at column 0
+        # and are not block sequence entries.
+        if not line.startswith((' ', '-', '\n')):
+            current = chunks.setdefault(line.partition(':')[0], [])
+        current.append(line)
+    return [''.join(chunks[param.name]) for param in params]
 
 
 def write_param_yaml(entry, param: 'ConfigurationPoint', output: TextIO) -> None:
@@ -271,11 +271,16 @@ def _load_file(filepath: str, error_name: str) -> Tuple[Dict[str, Any], List[str
     """
     read raw data and includes information from file
     """
-    if not os.path.isfile(filepath):
-        raise ValueError("{} does not exist".format(filepath))
     try:
         raw: Dict[str, Any] = read_pod(filepath)
         includes: List[str] = _process_includes(raw, filepath, error_name)
+    except OSError as e:
+        # Which error a missing file or a directory raises is platform
+        # dependent (e.g. PermissionError for directories on Windows), so
+        # only check what is at the path once opening it has failed.
+        if os.path.isfile(filepath):
+            raise
+        raise ValueError("{} does not exist".format(filepath)) from e
     except SerializerSyntaxError as e:
         raise ConfigError('Error parsing {} {}: {}'.format(error_name, filepath, e))
     if not isinstance(raw, dict):
@@ -200,6 +200,8 @@ class ExecutionContext(object):
         if not self.job_queue:
             raise RuntimeError('No jobs to run')
         self.current_job = self.job_queue.pop(0)
+        # Files may have been added or removed since the previous job
+        self.resolver.invalidate()
         job_output = init_job_output(self.run_output, self.current_job)
         self.current_job.set_output(job_output)
         return self.current_job
@@ -72,10 +72,10 @@ def get_generic_resource(resource: Resource, files: List[str]) -> Optional[str]:
     """
     get generic resource
     """
-    matches: List[str] = []
-    for f in files:
-        if resource.match(f):
-            matches.append(f)
+    if resource.always_match:
+        matches: List[str] = files
+    else:
+        matches = [f for f in files if resource.match(f)]
     if not matches:
         return None
     if len(matches) > 1:
@@ -43,6 +43,10 @@ class __LoaderWrapper(object):
 
     def __init__(self) -> None:
         self._loader: Optional[plugin.PluginLoader] = None
+        self._class_cache: Dict[Tuple[str, Optional[str]], Type[plugin.Plugin]] = {}
+        # bumped whenever the set of loaded plugins may have changed, so that
+        # callers caching data derived from the plugins can tell it is stale
+        self.generation: int = 0
 
     def reset(self):
         """
@@ -53,6 +57,8 @@ class __LoaderWrapper(object):
         # pylint: disable=import-outside-toplevel
         from wa.framework.plugin import PluginLoader
         from wa.framework.configuration.core import settings
+        self._class_cache.clear()
+        self.generation += 1
         self._loader = PluginLoader(settings.plugin_packages,
                                     settings.plugin_paths, [])
 
@@ -65,6 +71,8 @@ class __LoaderWrapper(object):
         if not self._loader:
             self.reset()
         if self._loader:
+            self._class_cache.clear()
+            self.generation += 1
             self._loader.update(packages, paths, ignore_paths)
 
     def reload(self) -> None:
@@ -74,8 +82,21 @@ class __LoaderWrapper(object):
         if not self._loader:
             self.reset()
         if self._loader:
+            self._class_cache.clear()
+            self.generation += 1
             self._loader.reload()
 
+    def clear(self) -> None:
+        """
+        clear all discovered plugins
+        """
+        if not self._loader:
+            self.reset()
+        if self._loader:
+            self._class_cache.clear()
+            self.generation += 1
+            self._loader.clear()
+
     def list_plugins(self, kind: Optional[str] = None) -> List[Type[plugin.Plugin]]:
         """
         List the plugins loaded
@@ -99,12 +120,19 @@ class __LoaderWrapper(object):
 
     def get_plugin_class(self, name: str, kind: Optional[str] = None) -> Type[plugin.Plugin]:
         """
-        get the class type of the plugin
+        get the class type of the plugin. Lookups are cached until the
+        loader is reset, updated or reloaded.
         """
         if not self._loader:
             self.reset()
         if self._loader:
-            return self._loader.get_plugin_class(name, kind)
+            key = (name, kind)
+            try:
+                return self._class_cache[key]
+            except KeyError:
+                plugin_cls = self._loader.get_plugin_class(name, kind)
+                self._class_cache[key] = plugin_cls
+                return plugin_cls
         else:
             return plugin.Plugin  # dummy to satisfy type checker.
 
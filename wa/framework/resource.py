@@ -24,22 +24,23 @@ from wa.utils import log
 from wa.utils.android import get_cacheable_apk_info, ApkInfo
 from wa.utils.misc import get_object_name
 from wa.utils.types import enum, list_or_string, prioritylist, version_tuple
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Pattern, Sequence, Tuple, Callable, Dict
 from types import ModuleType
 
 SourcePriority = enum(['package', 'remote', 'lan', 'local',
-                       'perferred'], start=0, step=10)
+                       'preferred'], start=0, step=10)
+# Misspelt name used by earlier versions; kept for backwards compatibility.
+SourcePriority.perferred = SourcePriority.preferred
 
 
 class __NullOwner(object):
     """Represents an owner for a resource not owned by anyone."""
 
+    __slots__ = ()
+
     name: str = 'noone'
     dependencies_directory: str = settings.dependencies_directory
 
-    def __getattr__(self, name: str):
-        return None
-
     def __str__(self):
         return 'no-one'
 
@@ -60,7 +61,12 @@ class Resource(object):
 
     """
 
+    __slots__ = ('owner',)
+
     kind: Optional[str] = None
+    # Set by resource types that match any candidate path of their kind,
+    # allowing getters to skip per-path matching.
+    always_match: bool = False
 
     def __init__(self, owner: object = NO_ONE):
         self.owner = owner
@@ -77,6 +83,27 @@ class Resource(object):
         """
         raise NotImplementedError()
 
+    def _signature(self) -> Optional[Tuple]:
+        """
+        A hashable tuple identifying this resource, used by
+        ``ResourceResolver`` to cache resolved paths. The owner is identified
+        by its kind and name, so that the cache does not keep it alive.
+        ``None`` means the resource is never cached.
+        """
+        owner_name: Optional[str] = getattr(self.owner, 'name', None)
+        fields: Optional[Tuple] = self._signature_fields()
+        if owner_name is None or fields is None:
+            return None
+        return (type(self), getattr(self.owner, 'kind', None), owner_name) + fields
+
+    def _signature_fields(self) -> Optional[Tuple]:
+        """
+        The attributes, other than the owner, that identify this resource.
+        Subclasses that may be cached must implement this; ``None`` (the
+        default) means the resource is never cached.
+        """
+        return None
+
     def __str__(self):
         return '<{}\'s {}>'.format(self.owner, self.kind)
 
@@ -85,6 +112,8 @@ class File(Resource):
     """
     File resource
     """
+    __slots__ = ('path',)
+
     kind: str = 'file'
 
     def __init__(self, owner: object, path: str):
@@ -94,6 +123,9 @@ class File(Resource):
     def match_path(self, path: str) -> bool:
         return self.path == path
 
+    def _signature_fields(self) -> Optional[Tuple]:
+        return (self.path,)
+
     def __str__(self):
         return '<{}\'s {} {} file>'.format(self.owner, self.kind, self.path)
 
@@ -102,6 +134,8 @@ class Executable(Resource):
     """
     Executable resource
     """
+    __slots__ = ('abi', 'filename')
+
     kind: str = 'executable'
 
     def __init__(self, owner: object, abi: str, filename: str):
@@ -112,6 +146,9 @@ class Executable(Resource):
     def match_path(self, path: str) -> bool:
         return self.filename == os.path.basename(path)
 
+    def _signature_fields(self) -> Optional[Tuple]:
+        return (self.abi, self.filename)
+
     def __str__(self):
         return '<{}\'s {} {} executable>'.format(self.owner, self.abi, self.filename)
 
@@ -120,6 +157,8 @@ class ReventFile(Resource):
     """
     Revent File resource
     """
+    __slots__ = ('stage', 'target')
+
     kind: str = 'revent'
 
     def __init__(self, owner: object, stage: str, target: Optional[str]):
@@ -129,31 +168,43 @@ class ReventFile(Resource):
 
     def match_path(self, path: str) -> bool:
         filename = os.path.basename(path)
-        parts = filename.split('.')
-        if len(parts) > 2:
-            target, stage = parts[:2]
-            return target == self.target and stage == self.stage
-        else:
-            stage = parts[0]
-            return stage == self.stage
+        first, _, rest = filename.partition('.')
+        second, sep, _ = rest.partition('.')
+        if sep:  # <target>.<stage>.<ext>
+            return first == self.target and second == self.stage
+        else:  # <stage>.<ext>
+            return first == self.stage
+
+    def _signature_fields(self) -> Optional[Tuple]:
+        return (self.stage, self.target)
 
 
 class JarFile(Resource):
     """
     Jar file resource
     """
+    __slots__ = ()
+
     kind: str = 'jar'
+    always_match: bool = True
 
     def match_path(self, path: str) -> bool:
         # An owner always  has at most one jar file, so
         # always match
         return True
 
+    def _signature_fields(self) -> Optional[Tuple]:
+        return ()
+
 
 class ApkFile(Resource):
     """
     Apk file resource
     """
+    __slots__ = ('variant', '_variant_re', 'version', 'max_version', 'min_version',
+                 'package', 'uiauto', 'exact_abi', 'supported_abi',
+                 '_versions', '_supported_abis')
+
     kind: str = 'apk'
 
     def __init__(self, owner: object, variant: Optional[str] = None,
@@ -162,6 +213,7 @@ class ApkFile(Resource):
                  min_version: Optional[str] = None, max_version: Optional[str] = None):
         super(ApkFile, self).__init__(owner)
         self.variant = variant
+        self._variant_re: Optional[Pattern[str]] = _compile_variant(variant) if variant else None
         self.version = version
         self.max_version = max_version
         self.min_version = min_version
@@ -169,33 +221,44 @@ class ApkFile(Resource):
         self.uiauto = uiauto
         self.exact_abi = exact_abi
         self.supported_abi = supported_abi
+        # Normalised forms of the above, used when matching candidate paths.
+        self._versions: Tuple[str, ...] = tuple(list_or_string(version)) if version else ()
+        self._supported_abis: Tuple[Optional[str], ...] = (tuple(list_or_string(supported_abi))
+                                                           if supported_abi else ())
 
     def match_path(self, path: str) -> bool:
-        ext = os.path.splitext(path)[1].lower()
-        return ext == '.apk'
+        return path[-4:].lower() == '.apk'
 
     def match(self, path: str) -> bool:
-        name_matches: bool = True
-        version_matches: bool = True
-        version_range_matches: bool = True
-        package_matches: bool = True
-        abi_matches: bool = True
-        uiauto_matches: bool = uiauto_test_matches(path, self.uiauto)
-        if self.version:
-            version_matches = apk_version_matches(path, self.version)
+        # The extension and file name can be checked without parsing the apk,
+        # so do that first; the apk info is then retrieved once for all
+        # other checks.
+        filename: str = os.path.basename(path)
+        if not self.match_path(filename):
+            return False
+        if self.variant and not _file_name_matches(filename, self.variant, self._variant_re):
+            return False
+        info: Optional[ApkInfo] = _get_apk_info(path)
+        if info is None:
+            return False
+        if not _uiauto_test_matches(info, self.uiauto):
+            return False
+        if self.package and not _package_name_matches(info, self.package):
+            return False
+        if self._supported_abis and not _apk_abi_matches(info, self._supported_abis,
+                                                         self.exact_abi):
+            return False
+        if self._versions and not _apk_version_matches(info, self._versions):
+            return False
         if self.max_version or self.min_version:
-            version_range_matches = apk_version_matches_range(path, self.min_version,
-                                                              self.max_version)
-        if self.variant:
-            name_matches = file_name_matches(path, self.variant)
-        if self.package:
-            package_matches = package_name_matches(path, self.package)
-        if self.supported_abi:
-            abi_matches = apk_abi_matches(path, self.supported_abi,
-                                          self.exact_abi)
-        return name_matches and version_matches and \
-            version_range_matches and uiauto_matches \
-            and package_matches and abi_matches
+            return range_version_matching(info.version_name, self.min_version,
+                                          self.max_version)
+        return True
+
+    def _signature_fields(self) -> Optional[Tuple]:
+        return (self.variant, self._versions, self.package,
+                self.uiauto, self.exact_abi, self._supported_abis,
+                self.min_version, self.max_version)
 
     def __str__(self) -> str:
         text = '<{}\'s apk'.format(self.owner)
@@ -253,6 +316,10 @@ class ResourceResolver(object):
     Discovers and registers getters, and then handles requests for
     resources using registered getters.
 
+    Sources are tried one at a time, in priority order. The built-in
+    getters are not safe to call concurrently (e.g. matching an
+    ``ApkFile`` may rewrite the apk info cache file).
+
     """
 
     def __init__(self, loader: ModuleType = pluginloader):
@@ -260,13 +327,18 @@ class ResourceResolver(object):
         self.logger = logging.getLogger('resolver')
         self.getters: List[ResourceGetter] = []
         self.sources = prioritylist()
+        # Priority-ordered snapshot of self.sources used by get(); rebuilt
+        # lazily after a new source is registered.
+        self._sources_snapshot: Optional[Tuple[Callable[[Resource], Optional[str]], ...]] = None
+        # Paths previously resolved, keyed on resource signature.
+        self._resolve_cache: Dict[Tuple, str] = {}
 
     def load(self) -> None:
         """
         load the resource getters to the resolver
         """
         for gettercls in self.loader.list_plugins('resource_getter'):
-            self.logger.debug('Loading getter {}'.format(gettercls.name))
+            self.logger.debug('Loading getter %s', gettercls.name)
             getter: ResourceGetter = self.loader.get_plugin(name=gettercls.name,
                                                             kind="resource_getter")
             with log.indentcontext():
@@ -278,9 +350,19 @@ class ResourceResolver(object):
         """
         register the source
         """
-        msg: str = 'Registering "{}" with priority "{}"'
-        self.logger.debug(msg.format(get_object_name(source), priority))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug('Registering "%s" with priority "%s"',
+                              get_object_name(source), priority)
         self.sources.add(source, priority)
+        self._sources_snapshot = None
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Discard previously resolved resource paths, e.g. because the files
+        available to the sources have changed.
+        """
+        self._resolve_cache.clear()
 
     def get(self, resource: Resource, strict: bool = True) -> Optional[str]:
         """
@@ -291,34 +373,75 @@ class ResourceResolver(object):
         ``None``.
 
         """
-        self.logger.debug('Resolving {}'.format(resource))
-        for source in self.sources:
-            source_name: Optional[str] = get_object_name(source)
-            self.logger.debug('Trying {}'.format(source_name))
+        signature: Optional[Tuple] = None
+        # Getters set to always fetch remote assets must be asked every time,
+        # so nothing is cached while any of them is loaded.
+        if not any(getattr(getter, 'always_fetch', False) for getter in self.getters):
+            signature = resource._signature()  # pylint: disable=protected-access
+        try:
+            cached: Optional[str] = self._resolve_cache.get(signature) if signature else None
+        except TypeError:  # unhashable resource attribute
+            signature = cached = None
+        debug: bool = self.logger.isEnabledFor(logging.DEBUG)
+        if cached is not None and os.path.exists(cached):
+            if debug:
+                self.logger.debug('Resource %s previously resolved to %s', resource, cached)
+            return cached
+
+        if self._sources_snapshot is None:
+            self._sources_snapshot = tuple(self.sources)
+        if debug:
+            self.logger.debug('Resolving %s', resource)
+        for source in self._sources_snapshot:
+            if debug:
+                source_name: Optional[str] = get_object_name(source)
+                self.logger.debug('Trying %s', source_name)
             result: str = source(resource)
             if result is not None:
-                msg: str = 'Resource {} found using {}:'
-                self.logger.debug(msg.format(resource, source_name))
-                self.logger.debug('\t{}'.format(result))
+                if debug:
+                    self.logger.debug('Resource %s found using %s:', resource, source_name)
+                    self.logger.debug('\t%s', result)
+                if signature:
+                    self._resolve_cache[signature] = result
                 return result
         if strict:
             raise ResourceError('{} could not be found'.format(resource))
-        self.logger.debug('Resource {} not found.'.format(resource))
+        if debug:
+            self.logger.debug('Resource %s not found.', resource)
         return None
 
 
+def _get_apk_info(path: Optional[str]) -> Optional[ApkInfo]:
+    """
+    Get the ``ApkInfo`` for the apk at ``path``. ``get_cacheable_apk_info``
+    keeps results in memory, keyed on the path and its modification time,
+    so the same apk is not looked up again (via the on-disk apk info cache
+    or aapt) each time it is considered as a candidate.
+    """
+    if not path:
+        return None
+    return get_cacheable_apk_info(path, os.stat(path).st_mtime)
+
+
 def apk_version_matches(path: str, version: Union[str, List[str]]):
     """
     check apk version matches
     """
-    version_ = list_or_string(version)
-    info: Optional[ApkInfo] = get_cacheable_apk_info(path)
-    for v in version_:
-        if info is not None:
-            if v in (info.version_name, info.version_code):
-                return True
-            if loose_version_matching(v, info.version_name):
-                return True
+    info: Optional[ApkInfo] = _get_apk_info(path)
+    if info is None:
+        return False
+    return _apk_version_matches(info, list_or_string(version))
+
+
+def _apk_version_matches(info: ApkInfo, versions: Sequence[str]) -> bool:
+    """
+    check the version of already retrieved apk info matches one of ``versions``
+    """
+    for v in versions:
+        if v in (info.version_name, info.version_code):
+            return True
+        if loose_version_matching(v, info.version_name):
+            return True
     return False
 
 
@@ -327,7 +450,7 @@ def apk_version_matches_range(path: str, min_version: Optional[str] = None,
     """
     check if the apk version matches the range of versions
     """
-    info = get_cacheable_apk_info(path)
+    info = _get_apk_info(path)
     return range_version_matching(info.version_name if info else '', min_version, max_version)
 
 
@@ -361,31 +484,54 @@ def loose_version_matching(config_version: str, apk_version: Optional[str]) -> b
     if len(apk_version_tuple) < len(config_version_tuple):
         return False  # More specific version requested than available
 
-    for i in range(len(config_version_tuple)):
-        if config_version_tuple[i] != apk_version_tuple[i]:
-            return False
-    return True
+    return all(c == a for c, a in zip(config_version_tuple, apk_version_tuple))
 
 
 def file_name_matches(path: str, pattern: str) -> bool:
     """
     check file name matches pattern
     """
-    filename = os.path.basename(path)
+    return _file_name_matches(os.path.basename(path), pattern)
+
+
+def _file_name_matches(filename: str, pattern: str,
+                       regex: Optional[Pattern[str]] = None) -> bool:
+    """
+    check file name (i.e. the base name of a path) matches pattern. ``regex``
+    may be specified to provide a pre-compiled version of ``pattern``.
+    """
     if pattern in filename:
         return True
-    if re.search(pattern, filename):
+    if (regex or re.compile(pattern)).search(filename):
         return True
     return False
 
 
+def _compile_variant(variant: str) -> Pattern[str]:
+    """
+    compile an apk variant pattern. Variants that are not valid regular
+    expressions are matched literally.
+    """
+    try:
+        return re.compile(variant)
+    except re.error:
+        return re.compile(re.escape(variant))
+
+
 def uiauto_test_matches(path: str, uiauto: bool) -> bool:
     """
     check uiauto matches
     """
-    info = get_cacheable_apk_info(path)
+    info = _get_apk_info(path)
     if info is None:
         return False
+    return _uiauto_test_matches(info, uiauto)
+
+
+def _uiauto_test_matches(info: ApkInfo, uiauto: bool) -> bool:
+    """
+    check uiauto matches for already retrieved apk info
+    """
     return uiauto == ('com.arm.wa.uiauto' in (info.package or ''))
 
 
@@ -393,9 +539,16 @@ def package_name_matches(path: str, package: str) -> bool:
     """
     check if package name matches
     """
-    info = get_cacheable_apk_info(path)
+    info = _get_apk_info(path)
     if info is None:
         return False
+    return _package_name_matches(info, package)
+
+
+def _package_name_matches(info: ApkInfo, package: str) -> bool:
+    """
+    check if package name of already retrieved apk info matches
+    """
     return info.package == package
 
 
@@ -404,18 +557,21 @@ def apk_abi_matches(path: str, supported_abi: Union[str, List[Optional[str]]],
     """
     check apk abi matches
     """
-    supported_abi_ = list_or_string(supported_abi)
-    info = get_cacheable_apk_info(path)
+    info = _get_apk_info(path)
     if info is None:
         return False
+    return _apk_abi_matches(info, list_or_string(supported_abi), exact_abi)
+
+
+def _apk_abi_matches(info: ApkInfo, supported_abis: Sequence[Optional[str]],
+                     exact_abi: bool = False) -> bool:
+    """
+    check abi of already retrieved apk info matches
+    """
     # If no native code present, suitable for all devices.
     if not info.native_code:
         return True
 
     if exact_abi:  # Only check primary
-        return supported_abi_[0] in info.native_code
-    else:
-        for abi in supported_abi_:
-            if abi in info.native_code:
-                return True
-    return False
+        return supported_abis[0] in info.native_code
+    return not set(info.native_code).isdisjoint(supported_abis)
@@ -14,6 +14,9 @@
 #
 
 import inspect
+import itertools
+import sys
+from collections.abc import Mapping
 
 from devlib.target import (DEFAULT_SHELL_PROMPT, LinuxTarget, AndroidTarget,
                            LocalLinuxTarget, ChromeOsTarget, Target)
@@ -25,23 +28,67 @@ from devlib.utils.ssh import SshConnection, TelnetConnection, Gem5Connection
 from devlib.host import LocalConnection
 from devlib.utils.annotation_helpers import SupportedConnections
 from devlib.utils.ssh import DEFAULT_SSH_SUDO_COMMAND
-from devlib.utils.misc import InitCheckpointMeta
+from devlib.utils.misc import InitCheckpointMeta, memoized
 from wa.framework import pluginloader
 from wa.framework.configuration.core import get_config_point_map
 from wa.framework.exception import PluginLoaderError
 from wa.framework.plugin import Plugin, Parameter
 from wa.framework.target.assistant import LinuxAssistant, AndroidAssistant, ChromeOsAssistant
-from wa.utils.types import list_of_strings, list_of_ints, regex, identifier, caseless_string
-from wa.utils.misc import isiterable
-from types import ModuleType
-from typing import (List, Dict, Union, cast, Tuple,
-                    Optional, Type, Any, Iterable)
+from wa.utils.types import list_of_strings, list_of_ints, regex, identifier
+from types import ModuleType, MappingProxyType
+from typing import (List, Dict, Union, cast, Tuple, NamedTuple,
+                    Optional, Type, Any, Iterable, Iterator, Callable)
 from typing_extensions import Protocol
 
 
+# id(loader) --> (loader, loader generation, name --> target description)
+_TARGET_DESC_CACHE: Dict[int, Tuple[Any, Any, Dict[str, 'TargetDescriptionProtocol']]] = {}
+
+
 def list_target_descriptions(loader: ModuleType = pluginloader) -> List['TargetDescriptionProtocol']:
     """
-    get list of all the target descriptions
+    get list of all the target descriptions. The descriptions are cached
+    per loader until its plugins are reset, updated or reloaded.
+    """
+    return list(_get_cached_target_descriptions(loader).values())
+
+
+def get_target_description(name: str, loader: ModuleType = pluginloader) -> 'TargetDescriptionProtocol':
+    """
+    get a specific target description
+    """
+    try:
+        return _get_cached_target_descriptions(loader)[name]
+    except KeyError:
+        raise ValueError('Could not find target descriptor "{}"'.format(name)) from None
+
+
+def _get_cached_target_descriptions(loader: ModuleType) -> Dict[str, 'TargetDescriptionProtocol']:
+    """
+    get the target descriptions of the loader by name, (re)building them if
+    they are missing or stale
+    """
+    entry = _TARGET_DESC_CACHE.get(id(loader))
+    if entry is None or entry[0] is not loader or entry[1] != getattr(loader, 'generation', None):
+        targets = _build_target_descriptions(loader)
+        entry = (loader, getattr(loader, 'generation', None), targets)
+        _TARGET_DESC_CACHE[id(loader)] = entry
+    return entry[2]
+
+
+def _clear_target_description_cache() -> None:
+    """
+    forget all cached target descriptions
+    """
+    _TARGET_DESC_CACHE.clear()
+
+
+list_target_descriptions.cache_clear = _clear_target_description_cache  # type: ignore[attr-defined]
+
+
+def _build_target_descriptions(loader: ModuleType) -> Dict[str, 'TargetDescriptionProtocol']:
+    """
+    instantiate every target descriptor and collect its descriptions by name
     """
     targets: Dict[str, 'TargetDescriptionProtocol'] = {}
     for cls in loader.list_target_descriptors():
@@ -54,17 +101,7 @@ def list_target_descriptions(loader: ModuleType = pluginloader) -> List['TargetD
                 raise PluginLoaderError(msg.format(desc.name, prev_dtor.name,
                                                    descriptor.name))
             targets[desc.name] = desc
-    return list(targets.values())
-
-
-def get_target_description(name: str, loader: ModuleType = pluginloader) -> 'TargetDescriptionProtocol':
-    """
-    get a specific target description
-    """
-    for tdesc in list_target_descriptions(loader):
-        if tdesc.name == name:
-            return tdesc
-    raise ValueError('Could not find target descriptor "{}"'.format(name))
+    return targets
 
 
 def instantiate_target(tdesc: 'TargetDescriptionProtocol', params: Dict[str, Parameter],
@@ -73,40 +110,27 @@ def instantiate_target(tdesc: 'TargetDescriptionProtocol', params: Dict[str, Par
     instantiate a target based on the target description and parameters
     """
     # pylint: disable=too-many-locals,too-many-branches
-    target_params = get_config_point_map(tdesc.target_params)
-    platform_params = get_config_point_map(tdesc.platform_params)
-    conn_params = get_config_point_map(tdesc.conn_params)
-    assistant_params = get_config_point_map(tdesc.assistant_params)
     tp: Dict[str, Any]
     pp: Dict[str, Any]
     cp: Dict[str, Any]
-    tp, pp, cp = {}, {}, {}
-
-    for supported_params, new_params in (target_params, tp), (platform_params, pp), (conn_params, cp):
-        for name, value in supported_params.items():
-            if value.default and name == value.name:
-                new_params[name] = value.default
+    tp, pp, cp = (defaults.copy() for defaults in tdesc.param_defaults)
 
+    param_buckets = tdesc.param_buckets
+    buckets = (tp, pp, cp)
     for name, value in params.items():
-        if name in target_params:
-            if not target_params[name].deprecated:
-                tp[name] = value
-        elif name in platform_params:
-            if not platform_params[name].deprecated:
-                pp[name] = value
-        elif name in conn_params:
-            if not conn_params[name].deprecated:
-                cp[name] = value
-        elif name in assistant_params:
-            pass
-        else:
+        try:
+            index = param_buckets[name]
+        except KeyError:
             msg = 'Unexpected parameter for {}: {}'
-            raise ValueError(msg.format(tdesc.name, name))
-
-    for pname, pval in (extra_platform_params or {}).items():
-        if pname in pp:
-            raise RuntimeError('Platform parameter clash: {}'.format(pname))
-        pp[pname] = pval
+            raise ValueError(msg.format(tdesc.name, name)) from None
+        if index is not None:
+            buckets[index][name] = value
+
+    if extra_platform_params:
+        for pname in extra_platform_params:
+            if pname in pp:
+                raise RuntimeError('Platform parameter clash: {}'.format(pname))
+        pp.update(extra_platform_params)
     # FIXME - Platform is not callable
     tp['platform'] = (tdesc.platform or Platform)(**pp)
     if cp:
@@ -124,12 +148,9 @@ def instantiate_assistant(tdesc: 'TargetDescriptionProtocol', params: Dict[str,
     """
     instantiate assistant to connect to the target
     """
-    assistant_params: Dict[str, Any] = {}
-    for param in tdesc.assistant_params:
-        if param.name in params:
-            assistant_params[param.name] = params[param.name]
-        elif param.default:
-            assistant_params[param.name] = param.default
+    assistant_params: Dict[str, Any] = tdesc.assistant_defaults.copy()
+    assistant_params.update((param.name, params[param.name])
+                            for param in tdesc.assistant_params if param.name in params)
     # FIXME - casting target to Any because, assistant can be linuxassistant or androidassistant. They need linuxtarget or androidtarget
     # respectively. Not sure how to annotate this
     return tdesc.assistant(cast(Any, target), **assistant_params)
@@ -149,6 +170,23 @@ class TargetDescriptionProtocol(Protocol):
     assistant_params: List[Parameter]
     conn: InitCheckpointMeta
 
+    @property
+    def param_maps(self) -> Tuple[Dict[str, Parameter], Dict[str, Parameter],
+                                  Dict[str, Parameter], Dict[str, Parameter]]:
+        ...
+
+    @property
+    def param_defaults(self) -> Tuple[MappingProxyType, MappingProxyType, MappingProxyType]:
+        ...
+
+    @property
+    def param_buckets(self) -> Dict[str, Optional[int]]:
+        ...
+
+    @property
+    def assistant_defaults(self) -> MappingProxyType:
+        ...
+
     def get_default_config(self) -> Dict[str, Any]:
         ...
 
@@ -157,11 +195,21 @@ class TargetDescription(object):
     """
     description of the target with target, platform, and assistant configurations
     """
+    __slots__ = ('name', 'source', 'description', 'target', 'platform', 'connection', 'conn',
+                 'assistant', 'target_params', 'platform_params', 'conn_params',
+                 'assistant_params', '_cache')
+
+    _param_attrs: Tuple[str, ...] = ('target_params', 'platform_params',
+                                     'conn_params', 'assistant_params')
+
     def __init__(self, name: str, source: Any, description: Optional[str] = None,
                  target: Optional[Type[Target]] = None, platform: Optional[Type[Platform]] = None,
                  conn: Optional[InitCheckpointMeta] = None, assistant: Optional[Union[LinuxAssistant, AndroidAssistant]] = None,
                  target_params: Optional[Dict[str, Parameter]] = None, platform_params: Optional[Dict[str, Parameter]] = None,
                  conn_params: Optional[Dict[str, Parameter]] = None, assistant_params: Optional[Dict[str, Parameter]] = None):
+        # values derived from the parameter lists; dropped whenever one of
+        # the lists is replaced
+        self._cache: Dict[str, Any] = {}
         self.name = name
         self.source = source
         self.description = description
@@ -174,31 +222,139 @@ class TargetDescription(object):
         self._set('conn_params', conn_params)
         self._set('assistant_params', assistant_params)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._param_attrs:
+            self._cache.clear()
+        super().__setattr__(name, value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The derived values are not part of the state, so that copies do not
+        # share (and clear) the original's cache.
+        return {name: getattr(self, name) for name in self.__slots__
+                if name != '_cache' and hasattr(self, name)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        object.__setattr__(self, '_cache', {})
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def param_maps(self) -> Tuple[Dict[str, Parameter], Dict[str, Parameter],
+                                  Dict[str, Parameter], Dict[str, Parameter]]:
+        """
+        config point maps of the target, platform, connection and assistant
+        parameters
+        """
+        return self._get_cached('param_maps', self._build_param_maps)
+
+    @property
+    def param_defaults(self) -> Tuple[MappingProxyType, MappingProxyType, MappingProxyType]:
+        """
+        read-only values of the target, platform and connection parameters
+        that have a default
+        """
+        return self._get_cached('param_defaults', self._build_param_defaults)
+
+    @property
+    def param_buckets(self) -> Dict[str, Optional[int]]:
+        """
+        parameter name or alias --> index of the target, platform or connection
+        parameters that take its value. Deprecated and assistant parameters
+        map to ``None`` as their values are not passed on.
+        """
+        return self._get_cached('param_buckets', self._build_param_buckets)
+
+    @property
+    def assistant_defaults(self) -> MappingProxyType:
+        """
+        read-only values of the assistant parameters that have a default
+        """
+        return self._get_cached('assistant_defaults', self._build_assistant_defaults)
+
+    @property
+    def default_config(self) -> MappingProxyType:
+        """
+        read-only default configuration for the target; use
+        ``get_default_config`` for a modifiable copy
+        """
+        return self._get_cached('default_config', self._build_default_config)
+
     def get_default_config(self) -> Dict[str, Any]:
         """
         get default configuration for the target
         """
-        param_attrs: List[str] = ['target_params', 'platform_params',
-                                  'conn_params', 'assistant_params']
+        return self.default_config.copy()
+
+    def _get_cached(self, key: str, build: Callable[[], Any]) -> Any:
+        """
+        get a value derived from the parameter lists, building it on first use
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = build()
+            return value
+
+    def _build_param_maps(self) -> Tuple[Dict[str, Parameter], ...]:
+        """
+        build the config point map of each parameter list
+        """
+        return tuple(get_config_point_map(getattr(self, pattr)) for pattr in self._param_attrs)
+
+    def _build_param_defaults(self) -> Tuple[MappingProxyType, ...]:
+        """
+        collect the defaults of the target, platform and connection parameters
+        """
+        # the maps also hold aliases; only take each default under its real name
+        return tuple(MappingProxyType({name: value.default for name, value in supported_params.items()
+                                       if value.default and name == value.name})
+                     for supported_params in self.param_maps[:3])
+
+    def _build_param_buckets(self) -> Dict[str, Optional[int]]:
+        """
+        classify every parameter name; the first list defining a name wins
+        """
+        buckets: Dict[str, Optional[int]] = {}
+        for index, supported_params in enumerate(self.param_maps):
+            for name, value in supported_params.items():
+                if name not in buckets:
+                    buckets[name] = None if index == 3 or value.deprecated else index
+        return buckets
+
+    def _build_assistant_defaults(self) -> MappingProxyType:
+        """
+        collect the defaults of the assistant parameters
+        """
+        return MappingProxyType({p.name: p.default for p in self.assistant_params if p.default})
+
+    def _build_default_config(self) -> MappingProxyType:
+        """
+        build the default configuration from the non-deprecated parameters
+        """
         config: Dict[str, Any] = {}
-        for pattr in param_attrs:
-            for p in getattr(self, pattr):
-                if not cast(Parameter, p).deprecated:
-                    config[cast(Parameter, p).name] = cast(Parameter, p).default
-        return config
+        for pattr in self._param_attrs:
+            params: List[Parameter] = getattr(self, pattr)
+            for p in params:
+                if not p.deprecated:
+                    config[p.name] = p.default
+        return MappingProxyType(config)
 
     def _set(self, attr: str, vals: Optional[Iterable]) -> None:
         """
         set values to the attributes
         """
+        msg = '{} must be iterable; got "{}"'
         if vals is None:
             vals = []
-        elif isiterable(vals):
-            if hasattr(vals, 'values'):
-                vals = list(vals.values())  # type: ignore
-        else:
-            msg = '{} must be iterable; got "{}"'
+        elif isinstance(vals, Mapping):
+            vals = list(vals.values())
+        elif isinstance(vals, str):
             raise ValueError(msg.format(attr, vals))
+        else:
+            try:
+                vals = list(vals)
+            except TypeError as e:
+                raise ValueError(msg.format(attr, vals)) from e
         setattr(self, attr, vals)
 
 
@@ -208,258 +364,191 @@ class TargetDescriptor(Plugin):
     """
     kind = 'target_descriptor'
 
-    def get_descriptions(self) -> List[TargetDescriptionProtocol]:  # pylint: disable=no-self-use
+    def get_descriptions(self) -> Iterable[TargetDescriptionProtocol]:  # pylint: disable=no-self-use
         """
-        get list of target description (class:'TargetDescription')
+        get the target descriptions (class:'TargetDescription') provided by this descriptor
         """
         return []
 
 
-COMMON_TARGET_PARAMS: List[Parameter] = [
-    Parameter('working_directory', kind=str,
-              description='''
-              On-target working directory that will be used by WA. This
-              directory must be writable by the user WA logs in as without
-              the need for privilege elevation.
-              '''),
-    Parameter('executables_directory', kind=str,
-              description='''
-              On-target directory where WA will install its executable
-              binaries.  This location must allow execution. This location does
-              *not* need to be writable by unprivileged users or rooted devices
-              (WA will install with elevated privileges as necessary).
-              '''),
-    Parameter('modules', kind=list,
-              description='''
-              A list of additional modules to be installed for the target.
-
-              ``devlib`` implements functionality for particular subsystems as
-              modules.  A number of "default" modules (e.g. for cpufreq
-              subsystem) are loaded automatically, unless explicitly disabled.
-              If additional modules need to be loaded, they may be specified
-              using this parameter.
-
-              Please see ``devlib`` documentation for information on the available
-              modules.
-              '''),
-    Parameter('load_default_modules', kind=bool, default=True,
-              description='''
-              A number of modules (e.g. for working with the cpufreq subsystem) are
-              loaded by default when a Target is instantiated. Setting this to
-              ``True`` would suppress that, ensuring that only the base Target
-              interface is initialized.
-
-              You may want to set this to ``False`` if there is a problem with one
-              or more default modules on your platform (e.g. your device is
-              unrooted and cpufreq is not accessible to unprivileged users), or
-              if ``Target`` initialization is taking too long for your platform.
-              '''),
-    Parameter('shell_prompt', kind=regex, default=DEFAULT_SHELL_PROMPT,
-              description='''
-              A regex that matches the shell prompt on the target.
-              '''),
-
-    Parameter('max_async', kind=int, default=50,
-              description='''
-            The maximum number of concurent asynchronous connections to the
-            target maintained at any time.
-            '''),
-]
-
-COMMON_PLATFORM_PARAMS: List[Parameter] = [
-    Parameter('core_names', kind=list_of_strings,
-              description='''
-              List of names of CPU cores in the order that they appear to the
-              kernel. If not specified, it will be inferred from the platform.
-              '''),
-    Parameter('core_clusters', kind=list_of_ints,
-              description='''
-              Cluster mapping corresponding to the cores in ``core_names``.
-              Cluster indexing starts at ``0``.  If not specified, this will be
-              inferred from ``core_names`` -- consecutive cores with the same
-              name will be assumed to share a cluster.
-              '''),
-    Parameter('big_core', kind=str,
-              description='''
-              The name of the big cores in a big.LITTLE system. If not
-              specified, this will be inferred, either from the name (if one of
-              the names in ``core_names`` matches known big cores), or by
-              assuming that the last cluster is big.
-              '''),
-    Parameter('model', kind=str,
-              description='''
-              Hardware model of the platform. If not specified, an attempt will
-              be made to read it from target.
-              '''),
-    Parameter('modules', kind=list,
-              description='''
-              An additional list of modules to be loaded into the target.
-              '''),
-]
-
-VEXPRESS_PLATFORM_PARAMS: List[Parameter] = [
-    Parameter('serial_port', kind=str,
-              description='''
-              The serial device/port on the host for the initial connection to
-              the target (used for early boot, flashing, etc).
-              '''),
-    Parameter('baudrate', kind=int,
-              description='''
-              Baud rate for the serial connection.
-              '''),
-    Parameter('vemsd_mount', kind=str,
-              description='''
-              VExpress MicroSD card mount location. This is a MicroSD card in
-              the VExpress device that is mounted on the host via USB. The card
-              contains configuration files for the platform and firmware and
-              kernel images to be flashed.
-              '''),
-    Parameter('bootloader', kind=str,
-              allowed_values=['uefi', 'uefi-shell', 'u-boot', 'bootmon'],
-              description='''
-              Selects the bootloader mechanism used by the board. Depending on
-              firmware version, a number of possible boot mechanisms may be use.
-
-              Please see ``devlib`` documentation for descriptions.
-              '''),
-    Parameter('hard_reset_method', kind=str,
-              allowed_values=['dtr', 'reboottxt'],
-              description='''
-              There are a couple of ways to reset VersatileExpress board if the
-              software running on the board becomes unresponsive. Both require
-              configuration to be enabled (please see ``devlib`` documentation).
-
-              ``dtr``: toggle the DTR line on the serial connection
-              ``reboottxt``: create ``reboot.txt`` in the root of the VEMSD mount.
-              '''),
-]
-
-GEM5_PLATFORM_PARAMS: List[Parameter] = [
-    Parameter('gem5_bin', kind=str, mandatory=True,
-              description='''
-              Path to the gem5 binary
-              '''),
-    Parameter('gem5_args', kind=str, mandatory=True,
-              description='''
-              Arguments to be passed to the gem5 binary
-              '''),
-    Parameter('gem5_virtio', kind=str, mandatory=True,
-              description='''
-              VirtIO device setup arguments to be passed to gem5. VirtIO is used
-              to transfer files between the simulation and the host.
-              '''),
-    Parameter('name', kind=str, default='gem5',
-              description='''
-              The name for the gem5 "device".
-              '''),
-]
-
-
-CONNECTION_PARAMS: Dict[InitCheckpointMeta, List[Parameter]] = {
-    AdbConnection: [
-        Parameter(
-            'device', kind=str,
-            aliases=['adb_name'],
-            description="""
-            ADB device name
-            """),
-        Parameter(
-            'adb_server', kind=str,
-            description="""
-            ADB server to connect to.
-            """),
-        Parameter(
-            'adb_port', kind=int,
-            description="""
-            ADB port to connect to.
-            """),
-        Parameter(
-            'poll_transfers', kind=bool,
-            default=True,
-            description="""
-            File transfers will be polled for activity. Inactive
-            file transfers are cancelled.
-            """),
-        Parameter(
-            'start_transfer_poll_delay', kind=int,
-            default=30,
-            description="""
-            How long to wait (s) for a transfer to complete
-            before polling transfer activity. Requires ``poll_transfers``
-            to be set.
-            """),
-        Parameter(
-            'total_transfer_timeout', kind=int,
-            default=3600,
-            description="""
-            The total time to elapse before a transfer is cancelled, regardless
-            of its activity. Requires ``poll_transfers`` to be set.
-            """),
-        Parameter(
-            'transfer_poll_period', kind=int,
-            default=30,
-            description="""
-            The period at which transfer activity is sampled. Requires
-            ``poll_transfers`` to be set. Too small values may cause
-            the destination size to appear the same over one or more sample
-            periods, causing improper transfer cancellation.
-            """),
-        Parameter(
-            'adb_as_root', kind=bool,
-            default=False,
-            description="""
-            Specify whether the adb server should be started in root mode.
-            """)
-    ],
-    SshConnection: [
-        Parameter(
-            'host', kind=str, mandatory=True,
-            description="""
-            Host name or IP address of the target.
-            """),
-        Parameter(
-            'username', kind=str, mandatory=True,
-            description="""
-            User name to connect with
-            """),
-        Parameter(
-            'password', kind=str,
-            description="""
-            Password to use.
-            (When connecting to a passwordless machine set to an
-            empty string to prevent attempting ssh key authentication.)
-            """),
-        Parameter(
-            'keyfile', kind=str,
-            description="""
-            Key file to use
-            """),
-        Parameter(
-            'port', kind=int,
-            default=22,
-            description="""
-            The port SSH server is listening on on the target.
-            """),
-        Parameter(
-            'strict_host_check', kind=bool, default=False,
-            description="""
-            Specify whether devices should be connected to if
-            their host key does not match the systems known host keys. """),
-        Parameter(
-            'sudo_cmd', kind=str,
-            default=DEFAULT_SSH_SUDO_COMMAND,
-            description="""
-            Sudo command to use. Must have ``{}`` specified
-            somewhere in the string it indicate where the command
-            to be run via sudo is to go.
-            """),
-        Parameter(
-            'use_scp', kind=bool,
-            default=False,
-            description="""
-            Allow using SCP as method of file transfer instead
-            of the default SFTP.
-            """),
+@memoized
+def _common_target_params() -> List[Parameter]:
+    """
+    parameters common to all targets
+    """
+    return [
+        Parameter('working_directory', kind=str,
+                  description='''
+                  On-target working directory that will be used by WA. This
+                  directory must be writable by the user WA logs in as without
+                  the need for privilege elevation.
+                  '''),
+        Parameter('executables_directory', kind=str,
+                  description='''
+                  On-target directory where WA will install its executable
+                  binaries.  This location must allow execution. This location does
+                  *not* need to be writable by unprivileged users or rooted devices
+                  (WA will install with elevated privileges as necessary).
+                  '''),
+        Parameter('modules', kind=list,
+                  description='''
+                  A list of additional modules to be installed for the target.
+
+                  ``devlib`` implements functionality for particular subsystems as
+                  modules.  A number of "default" modules (e.g. for cpufreq
+                  subsystem) are loaded automatically, unless explicitly disabled.
+                  If additional modules need to be loaded, they may be specified
+                  using this parameter.
+
+                  Please see ``devlib`` documentation for information on the available
+                  modules.
+                  '''),
+        Parameter('load_default_modules', kind=bool, default=True,
+                  description='''
+                  A number of modules (e.g. for working with the cpufreq subsystem) are
+                  loaded by default when a Target is instantiated. Setting this to
+                  ``True`` would suppress that, ensuring that only the base Target
+                  interface is initialized.
+
+                  You may want to set this to ``False`` if there is a problem with one
+                  or more default modules on your platform (e.g. your device is
+                  unrooted and cpufreq is not accessible to unprivileged users), or
+                  if ``Target`` initialization is taking too long for your platform.
+                  '''),
+        Parameter('shell_prompt', kind=regex, default=DEFAULT_SHELL_PROMPT,
+                  description='''
+                  A regex that matches the shell prompt on the target.
+                  '''),
+
+        Parameter('max_async', kind=int, default=50,
+                  description='''
+                The maximum number of concurent asynchronous connections to the
+                target maintained at any time.
+                '''),
+    ]
+
+
+@memoized
+def _common_platform_params() -> List[Parameter]:
+    """
+    parameters common to all platforms
+    """
+    return [
+        Parameter('core_names', kind=list_of_strings,
+                  description='''
+                  List of names of CPU cores in the order that they appear to the
+                  kernel. If not specified, it will be inferred from the platform.
+                  '''),
+        Parameter('core_clusters', kind=list_of_ints,
+                  description='''
+                  Cluster mapping corresponding to the cores in ``core_names``.
+                  Cluster indexing starts at ``0``.  If not specified, this will be
+                  inferred from ``core_names`` -- consecutive cores with the same
+                  name will be assumed to share a cluster.
+                  '''),
+        Parameter('big_core', kind=str,
+                  description='''
+                  The name of the big cores in a big.LITTLE system. If not
+                  specified, this will be inferred, either from the name (if one of
+                  the names in ``core_names`` matches known big cores), or by
+                  assuming that the last cluster is big.
+                  '''),
+        Parameter('model', kind=str,
+                  description='''
+                  Hardware model of the platform. If not specified, an attempt will
+                  be made to read it from target.
+                  '''),
+        Parameter('modules', kind=list,
+                  description='''
+                  An additional list of modules to be loaded into the target.
+                  '''),
+    ]
+
+
+@memoized
+def _vexpress_platform_params() -> List[Parameter]:
+    """
+    parameters of the versatile express platforms
+    """
+    return [
+        Parameter('serial_port', kind=str,
+                  description='''
+                  The serial device/port on the host for the initial connection to
+                  the target (used for early boot, flashing, etc).
+                  '''),
+        Parameter('baudrate', kind=int,
+                  description='''
+                  Baud rate for the serial connection.
+                  '''),
+        Parameter('vemsd_mount', kind=str,
+                  description='''
+                  VExpress MicroSD card mount location. This is a MicroSD card in
+                  the VExpress device that is mounted on the host via USB. The card
+                  contains configuration files for the platform and firmware and
+                  kernel images to be flashed.
+                  '''),
+        Parameter('bootloader', kind=str,
+                  allowed_values=['uefi', 'uefi-shell', 'u-boot', 'bootmon'],
+                  description='''
+                  Selects the bootloader mechanism used by the board. Depending on
+                  firmware version, a number of possible boot mechanisms may be use.
+
+                  Please see ``devlib`` documentation for descriptions.
+                  '''),
+        Parameter('hard_reset_method', kind=str,
+                  allowed_values=['dtr', 'reboottxt'],
+                  description='''
+                  There are a couple of ways to reset VersatileExpress board if the
+                  software running on the board becomes unresponsive. Both require
+                  configuration to be enabled (please see ``devlib`` documentation).
+
+                  ``dtr``: toggle the DTR line on the serial connection
+                  ``reboottxt``: create ``reboot.txt`` in the root of the VEMSD mount.
+                  '''),
+    ]
+
+
+@memoized
+def _gem5_platform_params() -> List[Parameter]:
+    """
+    parameters of the gem5 simulation platform
+    """
+    return [
+        Parameter('gem5_bin', kind=str, mandatory=True,
+                  description='''
+                  Path to the gem5 binary
+                  '''),
+        Parameter('gem5_args', kind=str, mandatory=True,
+                  description='''
+                  Arguments to be passed to the gem5 binary
+                  '''),
+        Parameter('gem5_virtio', kind=str, mandatory=True,
+                  description='''
+                  VirtIO device setup arguments to be passed to gem5. VirtIO is used
+                  to transfer files between the simulation and the host.
+                  '''),
+        Parameter('name', kind=str, default='gem5',
+                  description='''
+                  The name for the gem5 "device".
+                  '''),
+    ]
+
+
+class ChromeOsConnection(object):
+    """
+    key for the connection parameters of ChromeOS targets. devlib has no
+    such connection class; ``ChromeOsTarget`` sets up its own ssh and adb
+    connections and so takes the parameters of both.
+    """
+
+
+@memoized
+def _connection_params() -> Dict[InitCheckpointMeta, List[Parameter]]:
+    """
+    connection class --> connection parameters
+    """
+    # Parameters shared by several connections are defined once and reused.
+    poll_transfer_params: List[Parameter] = [
         Parameter(
             'poll_transfers', kind=bool,
             default=True,
@@ -491,162 +580,248 @@ CONNECTION_PARAMS: Dict[InitCheckpointMeta, List[Parameter]] = {
             the destination size to appear the same over one or more sample
             periods, causing improper transfer cancellation.
             """),
-        # Deprecated Parameters
-        Parameter(
-            'telnet', kind=str,
-            description="""
-            Original shell prompt to expect.
-            """,
-            deprecated=True),
-        Parameter(
-            'password_prompt', kind=str,
-            description="""
-            Password prompt to expect
-            """,
-            deprecated=True),
-        Parameter(
-            'original_prompt', kind=str,
-            description="""
-            Original shell prompt to expect.
-            """,
-            deprecated=True),
-    ],
-    TelnetConnection: [
-        Parameter(
-            'host', kind=str, mandatory=True,
-            description="""
-            Host name or IP address of the target.
-            """),
-        Parameter(
-            'username', kind=str, mandatory=True,
-            description="""
-            User name to connect with
-            """),
-        Parameter(
-            'password', kind=str,
-            description="""
-            Password to use.
-            """),
-        Parameter(
-            'port', kind=int,
-            description="""
-            The port SSH server is listening on on the target.
-            """),
-        Parameter(
-            'password_prompt', kind=str,
-            description="""
-            Password prompt to expect
-            """),
-        Parameter(
-            'original_prompt', kind=str,
-            description="""
-            Original shell prompt to expect.
-            """),
-        Parameter(
-            'sudo_cmd', kind=str,
-            default="sudo -- sh -c {}",
-            description="""
-            Sudo command to use. Must have ``{}`` specified
-            somewhere in the string it indicate where the command
-            to be run via sudo is to go.
-            """),
-    ],
-    Gem5Connection: [
-        Parameter(
-            'host', kind=str, mandatory=False,
-            description="""
-            Host name or IP address of the target.
-            """),
-        Parameter(
-            'username', kind=str, default='root',
-            description="""
-            User name to connect to gem5 simulation.
-            """),
-        Parameter(
-            'password', kind=str,
-            description="""
-            Password to use.
-            """),
-        Parameter(
-            'port', kind=int,
-            description="""
-            The port SSH server is listening on on the target.
-            """),
-        Parameter(
-            'password_prompt', kind=str,
-            description="""
-            Password prompt to expect
-            """),
-        Parameter(
-            'original_prompt', kind=str,
-            description="""
-            Original shell prompt to expect.
-            """),
-    ],
-    LocalConnection: [
-        Parameter(
-            'password', kind=str,
-            description="""
-            Password to use for sudo. if not specified, the user will
-            be prompted during intialization.
-            """),
-        Parameter(
-            'keep_password', kind=bool, default=True,
-            description="""
-            If ``True`` (the default), the password will be cached in
-            memory after it is first obtained from the user, so that the
-            user would not be prompted for it again.
-            """),
-        Parameter(
-            'unrooted', kind=bool, default=False,
-            description="""
-            Indicate that the target should be considered unrooted; do not
-            attempt sudo or ask the user for their password.
-            """),
-    ],
-}
+    ]
+    host_param = Parameter(
+        'host', kind=str, mandatory=True,
+        description="""
+        Host name or IP address of the target.
+        """)
+    username_param = Parameter(
+        'username', kind=str, mandatory=True,
+        description="""
+        User name to connect with
+        """)
+    password_param = Parameter(
+        'password', kind=str,
+        description="""
+        Password to use.
+        """)
+    port_param = Parameter(
+        'port', kind=int,
+        description="""
+        The port SSH server is listening on on the target.
+        """)
+    password_prompt_param = Parameter(
+        'password_prompt', kind=str,
+        description="""
+        Password prompt to expect
+        """)
+    original_prompt_param = Parameter(
+        'original_prompt', kind=str,
+        description="""
+        Original shell prompt to expect.
+        """)
+
+    params: Dict[InitCheckpointMeta, List[Parameter]] = {
+        AdbConnection: [
+            Parameter(
+                'device', kind=str,
+                aliases=['adb_name'],
+                description="""
+                ADB device name
+                """),
+            Parameter(
+                'adb_server', kind=str,
+                description="""
+                ADB server to connect to.
+                """),
+            Parameter(
+                'adb_port', kind=int,
+                description="""
+                ADB port to connect to.
+                """),
+            *poll_transfer_params,
+            Parameter(
+                'adb_as_root', kind=bool,
+                default=False,
+                description="""
+                Specify whether the adb server should be started in root mode.
+                """)
+        ],
+        SshConnection: [
+            host_param,
+            username_param,
+            Parameter(
+                'password', kind=str,
+                description="""
+                Password to use.
+                (When connecting to a passwordless machine set to an
+                empty string to prevent attempting ssh key authentication.)
+                """),
+            Parameter(
+                'keyfile', kind=str,
+                description="""
+                Key file to use
+                """),
+            Parameter(
+                'port', kind=int,
+                default=22,
+                description="""
+                The port SSH server is listening on on the target.
+                """),
+            Parameter(
+                'strict_host_check', kind=bool, default=False,
+                description="""
+                Specify whether devices should be connected to if
+                their host key does not match the systems known host keys. """),
+            Parameter(
+                'sudo_cmd', kind=str,
+                default=DEFAULT_SSH_SUDO_COMMAND,
+                description="""
+                Sudo command to use. Must have ``{}`` specified
+                somewhere in the string it indicate where the command
+                to be run via sudo is to go.
+                """),
+            Parameter(
+                'use_scp', kind=bool,
+                default=False,
+                description="""
+                Allow using SCP as method of file transfer instead
+                of the default SFTP.
+                """),
+            *poll_transfer_params,
+            # Deprecated Parameters
+            Parameter(
+                'telnet', kind=str,
+                description="""
+                Original shell prompt to expect.
+                """,
+                deprecated=True),
+            Parameter(
+                'password_prompt', kind=str,
+                description="""
+                Password prompt to expect
+                """,
+                deprecated=True),
+            Parameter(
+                'original_prompt', kind=str,
+                description="""
+                Original shell prompt to expect.
+                """,
+                deprecated=True),
+        ],
+        TelnetConnection: [
+            host_param,
+            username_param,
+            password_param,
+            port_param,
+            password_prompt_param,
+            original_prompt_param,
+            Parameter(
+                'sudo_cmd', kind=str,
+                default="sudo -- sh -c {}",
+                description="""
+                Sudo command to use. Must have ``{}`` specified
+                somewhere in the string it indicate where the command
+                to be run via sudo is to go.
+                """),
+        ],
+        Gem5Connection: [
+            Parameter(
+                'host', kind=str, mandatory=False,
+                description="""
+                Host name or IP address of the target.
+                """),
+            Parameter(
+                'username', kind=str, default='root',
+                description="""
+                User name to connect to gem5 simulation.
+                """),
+            password_param,
+            port_param,
+            password_prompt_param,
+            original_prompt_param,
+        ],
+        LocalConnection: [
+            Parameter(
+                'password', kind=str,
+                description="""
+                Password to use for sudo. if not specified, the user will
+                be prompted during intialization.
+                """),
+            Parameter(
+                'keep_password', kind=bool, default=True,
+                description="""
+                If ``True`` (the default), the password will be cached in
+                memory after it is first obtained from the user, so that the
+                user would not be prompted for it again.
+                """),
+            Parameter(
+                'unrooted', kind=bool, default=False,
+                description="""
+                Indicate that the target should be considered unrooted; do not
+                attempt sudo or ask the user for their password.
+                """),
+        ],
+    }
+    params[cast(InitCheckpointMeta, ChromeOsConnection)] = \
+        params[AdbConnection] + params[SshConnection]
+    return params
+
+
+class TargetSpec(NamedTuple):
+    """
+    a supported devlib target, and how to connect to it
+    """
+    target: Union[Type[LinuxTarget], Type[AndroidTarget], Type[ChromeOsTarget]]
+    conn: InitCheckpointMeta
+    unsupported_platforms: List[Type[Platform]]
+    params: List[Parameter]
+    defaults: Optional[List[Parameter]]
+
+
+class PlatformSpec(NamedTuple):
+    """
+    a supported devlib platform. ``conn``, if set, replaces the target's
+    connection, and ``target_defaults`` override the target's parameters.
+    """
+    platform: Type[Platform]
+    conn: Optional[InitCheckpointMeta]
+    conn_defaults: Optional[List[Parameter]]
+    params: List[Parameter]
+    defaults: Optional[List[Parameter]]
+    target_defaults: Optional[List[Parameter]]
+
+
+@memoized
+def _targets() -> Dict[str, TargetSpec]:
+    """
+    name --> TargetSpec
+    """
+    return {
+        'linux': TargetSpec(LinuxTarget, SshConnection, [], _common_target_params(), None),
+        'android': TargetSpec(AndroidTarget, AdbConnection, [], _common_target_params() +
+                    [Parameter('package_data_directory', kind=str, default='/data/data',
+                               description='''
+                              Directory containing Android data
+                              '''),
+                     ], None),
+        'chromeos': TargetSpec(ChromeOsTarget, cast(InitCheckpointMeta, ChromeOsConnection), [],
+                     _common_target_params() +
+                     [Parameter('package_data_directory', kind=str, default='/data/data',
+                                description='''
+                               Directory containing Android data
+                               '''),
+                     Parameter('android_working_directory', kind=str,
+                               description='''
+                              On-target working directory that will be used by WA for the
+                              android container. This directory must be writable by the user
+                              WA logs in as without the need for privilege elevation.
+                              '''),
+                     Parameter('android_executables_directory', kind=str,
+                               description='''
+                              On-target directory where WA will install its executable
+                              binaries for the android container. This location must allow execution.
+                              This location does *not* need to be writable by unprivileged users or
+                              rooted devices (WA will install with elevated privileges as necessary).
+                              directory must be writable by the user WA logs in as without
+                              the need for privilege elevation.
+                              '''),
+                      ], None),
+        'local': TargetSpec(LocalLinuxTarget, LocalConnection, [Juno, Gem5SimulationPlatform, TC2],
+                            _common_target_params(), None),
+    }
 
-CONNECTION_PARAMS[cast(InitCheckpointMeta, 'ChromeOsConnection')] = \
-    CONNECTION_PARAMS[AdbConnection] + CONNECTION_PARAMS[SshConnection]
-
-TargetTuple = Tuple[Tuple[Union[Type[LinuxTarget], Type[AndroidTarget], Type[ChromeOsTarget]],
-                          InitCheckpointMeta, List[Type[Platform]]],
-                    List[Parameter], Optional[List[Parameter]]]
-
-# name --> ((target_class, conn_class, unsupported_platforms), params_list, defaults)
-TARGETS: Dict[str, TargetTuple] = {
-    'linux': ((LinuxTarget, SshConnection, []), COMMON_TARGET_PARAMS, None),
-    'android': ((AndroidTarget, AdbConnection, []), COMMON_TARGET_PARAMS +
-                [Parameter('package_data_directory', kind=str, default='/data/data',
-                           description='''
-                          Directory containing Android data
-                          '''),
-                 ], None),
-    'chromeos': ((ChromeOsTarget, cast(InitCheckpointMeta, 'ChromeOsConnection'), []),
-                 COMMON_TARGET_PARAMS +
-                 [Parameter('package_data_directory', kind=str, default='/data/data',
-                            description='''
-                           Directory containing Android data
-                           '''),
-                 Parameter('android_working_directory', kind=str,
-                           description='''
-                          On-target working directory that will be used by WA for the
-                          android container. This directory must be writable by the user
-                          WA logs in as without the need for privilege elevation.
-                          '''),
-                 Parameter('android_executables_directory', kind=str,
-                           description='''
-                          On-target directory where WA will install its executable
-                          binaries for the android container. This location must allow execution.
-                          This location does *not* need to be writable by unprivileged users or
-                          rooted devices (WA will install with elevated privileges as necessary).
-                          directory must be writable by the user WA logs in as without
-                          the need for privilege elevation.
-                          '''),
-                  ], None),
-    'local': ((LocalLinuxTarget, LocalConnection, [Juno, Gem5SimulationPlatform, TC2]),
-              COMMON_TARGET_PARAMS, None),
-}
 
 # name --> assistant
 ASSISTANTS: Dict[str, Union[Type[LinuxAssistant], Type[AndroidAssistant]]] = {
@@ -656,91 +831,148 @@ ASSISTANTS: Dict[str, Union[Type[LinuxAssistant], Type[AndroidAssistant]]] = {
     'chromeos': ChromeOsAssistant
 }
 
-# Platform specific parameter overrides.
-JUNO_PLATFORM_OVERRIDES: List[Parameter] = [
-    Parameter('baudrate', kind=int, default=115200,
-              description='''
-                Baud rate for the serial connection.
-                '''),
-    Parameter('vemsd_mount', kind=str, default='/media/JUNO',
-              description='''
-                VExpress MicroSD card mount location. This is a MicroSD card in
-                the VExpress device that is mounted on the host via USB. The card
-                contains configuration files for the platform and firmware and
-                kernel images to be flashed.
-                '''),
-    Parameter('bootloader', kind=str, default='u-boot',
-              allowed_values=['uefi', 'uefi-shell', 'u-boot', 'bootmon'],
-              description='''
-                Selects the bootloader mechanism used by the board. Depending on
-                firmware version, a number of possible boot mechanisms may be use.
 
-                Please see ``devlib`` documentation for descriptions.
-                '''),
-    Parameter('hard_reset_method', kind=str, default='dtr',
-              allowed_values=['dtr', 'reboottxt'],
-              description='''
-                There are a couple of ways to reset VersatileExpress board if the
-                software running on the board becomes unresponsive. Both require
-                configuration to be enabled (please see ``devlib`` documentation).
-
-                ``dtr``: toggle the DTR line on the serial connection
-                ``reboottxt``: create ``reboot.txt`` in the root of the VEMSD mount.
-                '''),
-]
-TC2_PLATFORM_OVERRIDES: List[Parameter] = [
-    Parameter('baudrate', kind=int, default=38400,
-              description='''
-                Baud rate for the serial connection.
-                '''),
-    Parameter('vemsd_mount', kind=str, default='/media/VEMSD',
-              description='''
-                VExpress MicroSD card mount location. This is a MicroSD card in
-                the VExpress device that is mounted on the host via USB. The card
-                contains configuration files for the platform and firmware and
-                kernel images to be flashed.
-                '''),
-    Parameter('bootloader', kind=str, default='bootmon',
-              allowed_values=['uefi', 'uefi-shell', 'u-boot', 'bootmon'],
-              description='''
-                Selects the bootloader mechanism used by the board. Depending on
-                firmware version, a number of possible boot mechanisms may be use.
+@memoized
+def _juno_platform_overrides() -> List[Parameter]:
+    """
+    juno specific platform parameter overrides
+    """
+    return [
+        Parameter('baudrate', kind=int, default=115200,
+                  description='''
+                    Baud rate for the serial connection.
+                    '''),
+        Parameter('vemsd_mount', kind=str, default='/media/JUNO',
+                  description='''
+                    VExpress MicroSD card mount location. This is a MicroSD card in
+                    the VExpress device that is mounted on the host via USB. The card
+                    contains configuration files for the platform and firmware and
+                    kernel images to be flashed.
+                    '''),
+        Parameter('bootloader', kind=str, default='u-boot',
+                  allowed_values=['uefi', 'uefi-shell', 'u-boot', 'bootmon'],
+                  description='''
+                    Selects the bootloader mechanism used by the board. Depending on
+                    firmware version, a number of possible boot mechanisms may be use.
+
+                    Please see ``devlib`` documentation for descriptions.
+                    '''),
+        Parameter('hard_reset_method', kind=str, default='dtr',
+                  allowed_values=['dtr', 'reboottxt'],
+                  description='''
+                    There are a couple of ways to reset VersatileExpress board if the
+                    software running on the board becomes unresponsive. Both require
+                    configuration to be enabled (please see ``devlib`` documentation).
+
+                    ``dtr``: toggle the DTR line on the serial connection
+                    ``reboottxt``: create ``reboot.txt`` in the root of the VEMSD mount.
+                    '''),
+    ]
+
+
+@memoized
+def _tc2_platform_overrides() -> List[Parameter]:
+    """
+    tc2 specific platform parameter overrides
+    """
+    return [
+        Parameter('baudrate', kind=int, default=38400,
+                  description='''
+                    Baud rate for the serial connection.
+                    '''),
+        Parameter('vemsd_mount', kind=str, default='/media/VEMSD',
+                  description='''
+                    VExpress MicroSD card mount location. This is a MicroSD card in
+                    the VExpress device that is mounted on the host via USB. The card
+                    contains configuration files for the platform and firmware and
+                    kernel images to be flashed.
+                    '''),
+        Parameter('bootloader', kind=str, default='bootmon',
+                  allowed_values=['uefi', 'uefi-shell', 'u-boot', 'bootmon'],
+                  description='''
+                    Selects the bootloader mechanism used by the board. Depending on
+                    firmware version, a number of possible boot mechanisms may be use.
+
+                    Please see ``devlib`` documentation for descriptions.
+                    '''),
+        Parameter('hard_reset_method', kind=str, default='reboottxt',
+                  allowed_values=['dtr', 'reboottxt'],
+                  description='''
+                    There are a couple of ways to reset VersatileExpress board if the
+                    software running on the board becomes unresponsive. Both require
+                    configuration to be enabled (please see ``devlib`` documentation).
+
+                    ``dtr``: toggle the DTR line on the serial connection
+                    ``reboottxt``: create ``reboot.txt`` in the root of the VEMSD mount.
+                    '''),
+    ]
 
-                Please see ``devlib`` documentation for descriptions.
-                '''),
-    Parameter('hard_reset_method', kind=str, default='reboottxt',
-              allowed_values=['dtr', 'reboottxt'],
-              description='''
-                There are a couple of ways to reset VersatileExpress board if the
-                software running on the board becomes unresponsive. Both require
-                configuration to be enabled (please see ``devlib`` documentation).
-
-                ``dtr``: toggle the DTR line on the serial connection
-                ``reboottxt``: create ``reboot.txt`` in the root of the VEMSD mount.
-                '''),
-]
 
-# name --> ((platform_class, conn_class, conn_overrides), params_list, defaults, target_overrides)
 # Note: normally, connection is defined by the Target name, but
 #       platforms may choose to override it
 # Note: the target_overrides allows you to override common target_params for a
-# particular platform. Parameters you can override are in COMMON_TARGET_PARAMS
+# particular platform. Parameters you can override are in _common_target_params()
 # Example of overriding one of the target parameters: Replace last `None` with
 # a list of `Parameter` objects to be used instead.
-PLATFORMS: Dict[str, Tuple[Tuple[Type[Platform], Optional[InitCheckpointMeta], Optional[List[Parameter]]],
-                           Optional[List[Parameter]], Optional[List[Parameter]], Optional[List[Parameter]]]] = {
-    'generic': ((Platform, None, None), COMMON_PLATFORM_PARAMS, None, None),
-    'juno': ((Juno, None, [
-        Parameter('host', kind=str, mandatory=False,
-                  description="Host name or IP address of the target."),
-    ]
-    ), COMMON_PLATFORM_PARAMS + VEXPRESS_PLATFORM_PARAMS, JUNO_PLATFORM_OVERRIDES, None),
-    'tc2': ((TC2, None, None), COMMON_PLATFORM_PARAMS + VEXPRESS_PLATFORM_PARAMS,
-            TC2_PLATFORM_OVERRIDES, None),
-    'gem5': ((Gem5SimulationPlatform, Gem5Connection, None), GEM5_PLATFORM_PARAMS, None, None),
+@memoized
+def _platforms() -> Dict[str, PlatformSpec]:
+    """
+    name --> PlatformSpec
+    """
+    return {
+        'generic': PlatformSpec(Platform, None, None, _common_platform_params(), None, None),
+        'juno': PlatformSpec(Juno, None, [
+            Parameter('host', kind=str, mandatory=False,
+                      description="Host name or IP address of the target."),
+        ], _common_platform_params() + _vexpress_platform_params(), _juno_platform_overrides(), None),
+        'tc2': PlatformSpec(TC2, None, None, _common_platform_params() + _vexpress_platform_params(),
+                            _tc2_platform_overrides(), None),
+        'gem5': PlatformSpec(Gem5SimulationPlatform, Gem5Connection, None, _gem5_platform_params(), None, None),
+    }
+
+
+# The parameter tables are only built when first needed, so that importing
+# this module stays cheap. The old module-level names remain available.
+_LAZY_TABLES: Dict[str, Callable[[], Any]] = {
+    'COMMON_TARGET_PARAMS': _common_target_params,
+    'COMMON_PLATFORM_PARAMS': _common_platform_params,
+    'VEXPRESS_PLATFORM_PARAMS': _vexpress_platform_params,
+    'GEM5_PLATFORM_PARAMS': _gem5_platform_params,
+    'CONNECTION_PARAMS': _connection_params,
+    'TARGETS': _targets,
+    'JUNO_PLATFORM_OVERRIDES': _juno_platform_overrides,
+    'TC2_PLATFORM_OVERRIDES': _tc2_platform_overrides,
+    'PLATFORMS': _platforms,
 }
 
 
+def __getattr__(name: str) -> Any:
+    """
+    build a parameter table on first access by its old module-level name
+    """
+    build = _LAZY_TABLES.get(name)
+    if build is None:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    return build()
+
+
+# descriptor class --> descriptions built by DefaultTargetDescriptor
+_default_descriptions: Dict[Type['DefaultTargetDescriptor'], List[TargetDescriptionProtocol]] = {}
+
+
+def _apply_param_overrides(params: List[Parameter], overrides: List[Parameter]) -> List[Parameter]:
+    """
+    get a new list of parameters, replacing any parameter with the one of
+    the same name in overrides
+    """
+    param_map: Dict[str, Parameter] = {p.name: p for p in params}
+    for override in overrides:
+        if override.name in param_map:
+            param_map[override.name] = override
+    # Return the list of overriden parameters
+    return list(param_map.values())
+
+
 class DefaultTargetDescriptor(TargetDescriptor):
     """
     default target descriptor plugin
@@ -755,39 +987,46 @@ class DefaultTargetDescriptor(TargetDescriptor):
 
     """
 
-    def get_descriptions(self) -> List[TargetDescriptionProtocol]:
+    def get_descriptions(self) -> Iterator[TargetDescriptionProtocol]:
+        # The descriptions only depend on the module's parameter tables, so
+        # they are built once per descriptor class and then reused.
+        try:
+            descriptions = _default_descriptions[type(self)]
+        except KeyError:
+            descriptions = _default_descriptions[type(self)] = list(self._iter_descriptions())
+        return iter(descriptions)
+
+    def _iter_descriptions(self) -> Iterator[TargetDescriptionProtocol]:
+        """
+        build a description for every supported target and platform pairing
+        """
         # pylint: disable=attribute-defined-outside-init,too-many-locals
-        result: List[TargetDescriptionProtocol] = []
-        for target_name, target_tuple in TARGETS.items():
-            (target, conn, unsupported_platforms), target_params = self._get_item(target_tuple)
-            assistant: Union[Type[LinuxAssistant], Type[AndroidAssistant]] = ASSISTANTS[target_name]
-            conn_params: List[Parameter] = CONNECTION_PARAMS[conn]
-            for platform_name, platform_tuple in PLATFORMS.items():
-                platform_target_defaults: Optional[List[Parameter]] = platform_tuple[-1]
-                platform_tuple_slice = platform_tuple[0:-1]
-                (platform, plat_conn, conn_defaults), platform_params = self._get_item(platform_tuple_slice)
-                if platform in unsupported_platforms:
-                    continue
-                # Add target defaults specified in the Platform tuple
-                target_params = self._override_params(target_params, platform_target_defaults)
-                name = '{}_{}'.format(platform_name, target_name)
-                td: TargetDescriptionProtocol = cast(TargetDescriptionProtocol, TargetDescription(name, self))
-                td.target = target
-                td.platform = platform
-                td.assistant = assistant
-                td.target_params = target_params
-                td.platform_params = platform_params
-                td.assistant_params = assistant.parameters
-
-                if plat_conn:
-                    td.conn = plat_conn
-                    td.conn_params = self._override_params(CONNECTION_PARAMS[plat_conn],
-                                                           conn_defaults)
-                else:
-                    td.conn = conn
-                    td.conn_params = self._override_params(conn_params, conn_defaults)
-                result.append(td)
-        return result
+        connection_params = _connection_params()
+        # Apply each target's and platform's own defaults once, rather than
+        # once per pairing.
+        targets = [(target_name, spec, self._override_params(spec.params, spec.defaults))
+                   for target_name, spec in _targets().items()]
+        platforms = [(platform_name, spec, self._override_params(spec.params, spec.defaults))
+                     for platform_name, spec in _platforms().items()]
+
+        for (target_name, tspec, target_params), (platform_name, pspec, platform_params) in \
+                itertools.product(targets, platforms):
+            if pspec.platform in tspec.unsupported_platforms:
+                continue
+            name = '{}_{}'.format(platform_name, target_name)
+            td: TargetDescriptionProtocol = cast(TargetDescriptionProtocol, TargetDescription(name, self))
+            td.target = tspec.target
+            td.platform = pspec.platform
+            td.assistant = ASSISTANTS[target_name]
+            # Add target defaults specified in the PlatformSpec
+            td.target_params = self._override_params(target_params, pspec.target_defaults)
+            td.platform_params = platform_params
+            td.assistant_params = td.assistant.parameters
+
+            td.conn = pspec.conn or tspec.conn
+            td.conn_params = self._override_params(connection_params[td.conn],
+                                                   pspec.conn_defaults)
+            yield td
 
     def _override_params(self, params: List[Parameter],
                          overrides: Optional[List[Parameter]]) -> List[Parameter]:  # pylint: disable=no-self-use
@@ -795,65 +1034,45 @@ class DefaultTargetDescriptor(TargetDescriptor):
         corresponding parameter in overrides'''
         if not overrides:
             return params
-        param_map: Dict[str, Parameter] = {p.name: p for p in params}
-        for override in overrides:
-            if override.name in param_map:
-                param_map[override.name] = override
-        # Return the list of overriden parameters
-        return list(param_map.values())
-
-    # FIXME - cannot make exact type annotation for the cls_tuple being returned as the two usages
-    # (target tuple vs platform tuple) are not having same types
-    def _get_item(self, item_tuple: Tuple) -> Tuple[Tuple, List[Parameter]]:
-        """
-        get the item tuple of target descriptor or platform descriptor
-        """
-        cls_tuple: Union[Tuple[Union[Type[LinuxTarget], Type[AndroidTarget], Type[ChromeOsTarget]],
-                               InitCheckpointMeta, List[Type[Platform]]],
-                         Tuple[Type[Platform], Optional[InitCheckpointMeta], Optional[List[Parameter]]]]
-        cls_tuple, params, defaults = item_tuple
-        updated_params = self._override_params(params, defaults)
-        return cls_tuple, updated_params
+        return _apply_param_overrides(params, overrides)
 
 
-_adhoc_target_descriptions: List[TargetDescription] = []
+# lowercased name --> target description (names are compared caselessly)
+_adhoc_target_descriptions: Dict[str, TargetDescription] = {}
 
 
 def create_target_description(name: str, *args, **kwargs) -> None:
     name = identifier(name)
-    for td in _adhoc_target_descriptions:
-        if caseless_string(name) == td.name:
-            msg: str = 'Target with name "{}" already exists (from source: {})'
-            raise ValueError(msg.format(name, td.source))
-
-    stack: List[inspect.FrameInfo] = inspect.stack()
-    # inspect.stack() returns a list of call frame records for the current thread
-    # in reverse call order. So the first entry is for the current frame and next one
-    # for the immediate caller. Each entry is a tuple in the format
-    #  (frame_object, module_path, line_no, function_name, source_lines, source_lines_index)
-    #
+    key: str = name.lower()
+    if key in _adhoc_target_descriptions:
+        msg: str = 'Target with name "{}" already exists (from source: {})'
+        raise ValueError(msg.format(name, _adhoc_target_descriptions[key].source))
+
     # Here we assign the path of the calling module as the "source" for this description.
     # because this might be invoked via the add_scription_for_target wrapper, we need to
     # check for that, and make sure that we get the info for *its* caller in that case.
-    if stack[1][3] == 'add_description_for_target':
-        source: str = stack[2][1]
-    else:
-        source = stack[1][1]
+    # sys._getframe() is used rather than inspect.stack(), as the latter builds a record,
+    # including source lines read from disk, for every frame on the stack.
+    caller = sys._getframe(1)  # pylint: disable=protected-access
+    if caller.f_code.co_name == 'add_description_for_target' and caller.f_back is not None:
+        caller = caller.f_back
+    source: str = caller.f_code.co_filename
 
-    _adhoc_target_descriptions.append(TargetDescription(name, source, *args, **kwargs))
+    _adhoc_target_descriptions[key] = TargetDescription(name, source, *args, **kwargs)
+    _clear_target_description_cache()
 
 
-def _get_target_defaults(target: Type[Target]) -> Tuple[str, TargetTuple]:
+def _get_target_defaults(target: Type[Target]) -> Tuple[str, TargetSpec]:
     """
     get defaults for target
     """
     specificity: int = 0
-    res: Tuple[str, TargetTuple] = ('linux', TARGETS['linux'])  # fallback to a generic linux target
-    for name, ttup in TARGETS.items():
-        if issubclass(target, ttup[0][0]):
-            new_spec: int = len(inspect.getmro(ttup[0][0]))
+    res: Tuple[str, TargetSpec] = ('linux', _targets()['linux'])  # fallback to a generic linux target
+    for name, tspec in _targets().items():
+        if issubclass(target, tspec.target):
+            new_spec: int = len(inspect.getmro(tspec.target))
             if new_spec > specificity:
-                res = (name, ttup)
+                res = (name, tspec)
                 specificity = new_spec
     return res
 
@@ -870,4 +1089,4 @@ class SimpleTargetDescriptor(TargetDescriptor):
     """
 
     def get_descriptions(self):
-        return _adhoc_target_descriptions
+        return list(_adhoc_target_descriptions.values())
@@ -15,7 +15,9 @@
 
 import logging
 import os
+import re
 from datetime import datetime
+from functools import lru_cache
 from shlex import quote
 
 from devlib.utils.android import ApkInfo as _ApkInfo
@@ -24,16 +26,27 @@ from wa.framework.configuration import settings
 from wa.utils.serializer import read_pod, write_pod, Podable
 from wa.utils.types import enum
 from wa.utils.misc import atomic_write_path
-from typing import Optional, List, Generator, Any, Dict
+from typing import Optional, List, Generator, Any, Dict, Tuple
 
 LogcatLogLevel = enum(['verbose', 'debug', 'info', 'warn', 'error', 'assert'], start=2)
 
 log_level_map: str = ''.join(n[0].upper() for n in LogcatLogLevel.names)
 
+# logcat captures can run to hundreds of megabytes; read them in large chunks
+LOGCAT_READ_BUFFER_SIZE: int = 1024 * 1024
+
+# logcat level letter --> LogcatLogLevel
+_level_by_char: Dict[str, Any] = dict(zip(log_level_map, LogcatLogLevel.levels))
+
+# <month>-<day> <hour>:<minute>:<second>.<fraction> <pid> <tid> <level> [<tag>]: <message>
+_logcat_line_regex = re.compile(r'(\d{{1,2}})-(\d{{1,2}})\s+(\d{{1,2}}):(\d{{1,2}}):(\d{{1,2}})\.(\d{{1,6}})\s+'
+                                r'(-?\d+)\s+(-?\d+)\s+([{}])(?:\s+(.*?))?\s*: (.*)'.format(log_level_map))
+
 logcat_logger: logging.Logger = logging.getLogger('logcat')
 apk_info_cache_logger: logging.Logger = logging.getLogger('apk_info_cache')
 
-apk_info_cache = None
+# created on first use; see _get_apk_info_cache()
+apk_info_cache: Optional['ApkInfoCache'] = None
 
 
 class LogcatEvent(object):
@@ -69,36 +82,39 @@ class LogcatParser(object):
         """
         parse logcat event file
         """
-        with open(filepath, errors='replace') as fh:
+        # logcat does not record the year; assume the current one
+        year: int = datetime.now().year
+        with open(filepath, errors='replace', buffering=LOGCAT_READ_BUFFER_SIZE) as fh:
             for line in fh:
-                event: Optional[LogcatEvent] = self.parse_line(line)
+                event: Optional[LogcatEvent] = self.parse_line(line, year)
                 if event:
                     yield event
 
-    def parse_line(self, line: str) -> Optional[LogcatEvent]:  # pylint: disable=no-self-use
+    def parse_line(self, line: str, year: Optional[int] = None) -> Optional[LogcatEvent]:  # pylint: disable=no-self-use
         """
-        parse one logcat line
+        parse one logcat line. ``year`` defaults to the current year.
         """
         line = line.strip()
         if not line or line.startswith('-') or ': ' not in line:
             return None
 
-        metadata, message = line.split(': ', 1)
-
-        parts: List[str] = metadata.split(None, 5)
+        match = _logcat_line_regex.match(line)
+        if match is None:
+            message = 'Invalid metadata for line:\n\t{}\n\tgot: "{}"'
+            logcat_logger.warning(message.format(line, 'unrecognised format'))
+            return None
+        month, day, hour, minute, second, fraction, pid, tid, level_char, tag, message = match.groups()
         try:
-            ts: str = ' '.join([parts.pop(0), parts.pop(0)])
-            timestamp: datetime = datetime.strptime(ts, '%m-%d %H:%M:%S.%f').replace(year=datetime.now().year)
-            pid = int(parts.pop(0))
-            tid = int(parts.pop(0))
-            level = LogcatLogLevel.levels[log_level_map.index(parts.pop(0))]
-            tag: str = (parts.pop(0) if parts else '').strip()
-        except Exception as e:  # pylint: disable=broad-except
+            timestamp: datetime = datetime(year or datetime.now().year, int(month), int(day),
+                                           int(hour), int(minute), int(second),
+                                           int(fraction.ljust(6, '0')))
+        except ValueError as e:
             message = 'Invalid metadata for line:\n\t{}\n\tgot: "{}"'
             logcat_logger.warning(message.format(line, e))
             return None
+        level = _level_by_char[level_char]
 
-        return LogcatEvent(timestamp, pid, tid, level, tag, message)
+        return LogcatEvent(timestamp, int(pid), int(tid), level, tag or '', message)
 
 
 # pylint: disable=protected-access,attribute-defined-outside-init
@@ -107,21 +123,18 @@ class ApkInfo(_ApkInfo, Podable):
 
     _pod_serialization_version: int = 1
 
+    # attributes copied verbatim to and from the pod
+    _pod_fields: Tuple[str, ...] = ('path', 'package', 'activity', 'label', 'version_name',
+                                    'version_code', 'native_code', 'permissions', '_apk_path')
+
     @staticmethod
     def from_pod(pod: Dict[str, Any]) -> 'ApkInfo':
         """
         create ApkInfo from pod
         """
         instance = ApkInfo()
-        instance.path = pod['path']
-        instance.package = pod['package']
-        instance.activity = pod['activity']
-        instance.label = pod['label']
-        instance.version_name = pod['version_name']
-        instance.version_code = pod['version_code']
-        instance.native_code = pod['native_code']
-        instance.permissions = pod['permissions']
-        instance._apk_path = pod['_apk_path']
+        for field in ApkInfo._pod_fields:
+            setattr(instance, field, pod[field])
         instance._activities = pod['_activities']
         instance._methods = pod['_methods']
         return instance
@@ -130,22 +143,20 @@ class ApkInfo(_ApkInfo, Podable):
         super().__init__(path)
         self._pod_version = self._pod_serialization_version
 
-    def to_pod(self) -> Dict[str, Any]:
+    def to_pod(self, deep: bool = True) -> Dict[str, Any]:
         """
-        convert ApkInfo to pod
+        convert ApkInfo to pod. Unless ``deep`` is ``True``, activities and
+        methods that have not been extracted yet are stored as ``None`` and
+        will be extracted from the apk when first accessed.
         """
         pod = super().to_pod()
-        pod['path'] = self.path
-        pod['package'] = self.package
-        pod['activity'] = self.activity
-        pod['label'] = self.label
-        pod['version_name'] = self.version_name
-        pod['version_code'] = self.version_code
-        pod['native_code'] = self.native_code
-        pod['permissions'] = self.permissions
-        pod['_apk_path'] = self._apk_path
-        pod['_activities'] = self.activities  # Force extraction
-        pod['_methods'] = self.methods  # Force extraction
+        pod.update((field, getattr(self, field)) for field in self._pod_fields)
+        if deep:
+            pod['_activities'] = self.activities  # Force extraction
+            pod['_methods'] = self.methods  # Force extraction
+        else:
+            pod['_activities'] = self._activities
+            pod['_methods'] = self._methods
         return pod
 
     @staticmethod
@@ -172,21 +183,26 @@ class ApkInfoCache:
     def __init__(self, path: str = settings.apk_info_cache_file):
         self._check_env()
         self.path = path
-        self.last_modified: Optional[os.stat_result] = None
+        # (inode, mtime) of the cache file when it was last read or written
+        self.last_modified: Optional[Tuple[int, int]] = None
         self.cache: Dict[str, Dict] = {}
         self._update_cache()
 
-    def store(self, apk_info: ApkInfo, apk_id: str, overwrite: bool = True) -> None:
+    def store(self, apk_info: ApkInfo, apk_id: str, overwrite: bool = True,
+              deep: bool = True) -> None:
         """
-        store Apk Info into cache
+        store Apk Info into cache. See ``ApkInfo.to_pod`` for ``deep``.
         """
         self._update_cache()
         if apk_id in self.cache and not overwrite:
             raise ValueError('ApkInfo for {} is already in cache.'.format(apk_info.path))
-        self.cache[apk_id] = apk_info.to_pod()
+        self.cache[apk_id] = apk_info.to_pod(deep)
         with atomic_write_path(self.path) as at_path:
             write_pod(self.cache, at_path)
-        self.last_modified = os.stat(self.path)
+        # The temporary file may live on another filesystem and be copied
+        # rather than renamed into place, so only the final file's stat
+        # identifies what was written.
+        self.last_modified = self._get_file_version()
 
     def get_info(self, key: str) -> Optional[ApkInfo]:
         """
@@ -200,44 +216,74 @@ class ApkInfoCache:
 
     def _update_cache(self) -> None:
         """
-        update apk info cache
+        update apk info cache, re-reading the file only if another process
+        has changed it. ``store`` records the version it writes, so our own
+        writes are not read back.
         """
-        if not os.path.exists(self.path):
+        version = self._get_file_version()
+        if version is None or version == self.last_modified:
             return
-        if self.last_modified != os.stat(self.path):
-            apk_info_cache_logger.debug('Updating cache {}'.format(self.path))
-            self.cache = read_pod(self.path)
-            self.last_modified = os.stat(self.path)
+        apk_info_cache_logger.debug('Updating cache {}'.format(self.path))
+        self.cache = read_pod(self.path)
+        self.last_modified = version
+
+    def _get_file_version(self) -> Optional[Tuple[int, int]]:
+        """
+        get the (inode, mtime) of the cache file, or None if it does not exist
+        """
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns
 
 
-def get_cacheable_apk_info(path: Optional[str]) -> Optional[ApkInfo]:
+def get_cacheable_apk_info(path: Optional[str], modified: Optional[float] = None) -> Optional[ApkInfo]:
     """
-    get cacheable apk info
+    get cacheable apk info. ``modified`` may be used to pass in the apk's
+    modification time if the caller has already obtained it. The returned
+    ``ApkInfo`` may be shared with other callers and must not be modified.
     """
-    # pylint: disable=global-statement
-    global apk_info_cache
     if not path:
         return None
-    stat: os.stat_result = os.stat(path)
-    modified: float = stat.st_mtime
+    if modified is None:
+        modified = os.stat(path).st_mtime
+    return _get_apk_info(path, modified)
+
+
+@lru_cache(maxsize=128)
+def _get_apk_info(path: str, modified: float) -> ApkInfo:
+    """
+    get the info for a version of an apk from the apk info cache, extracting
+    and storing it if it is not there. Results are also kept in memory, as
+    the path and modification time identify the version of the apk.
+    """
     apk_id: str = '{}-{}'.format(path, modified)
-    if apk_info_cache:
-        info = apk_info_cache.get_info(apk_id)
-    else:
-        info = None
+    cache = _get_apk_info_cache()
+    info = cache.get_info(apk_id)
 
     if info:
         msg: str = 'Using ApkInfo ({}) from cache'.format(info.package)
     else:
         info = ApkInfo(path)
-        if apk_info_cache:
-            apk_info_cache.store(info, apk_id, overwrite=True)
-            msg = 'Storing ApkInfo ({}) in cache'.format(info.package)
+        # Extracting activities and methods runs aapt/dexdump over the apk and
+        # few workloads use them, so leave that until they are accessed.
+        cache.store(info, apk_id, overwrite=True, deep=False)
+        msg = 'Storing ApkInfo ({}) in cache'.format(info.package)
     apk_info_cache_logger.debug(msg)
     return info
 
 
-apk_info_cache = ApkInfoCache()
+def _get_apk_info_cache() -> ApkInfoCache:
+    """
+    get the shared apk info cache, loading it on first use rather than
+    whenever this module is imported
+    """
+    # pylint: disable=global-statement
+    global apk_info_cache
+    if apk_info_cache is None:
+        apk_info_cache = ApkInfoCache()
+    return apk_info_cache
 
 
 def build_apk_launch_command(package: Optional[str], activity: Optional[str] = None,
@@ -245,12 +291,15 @@ def build_apk_launch_command(package: Optional[str], activity: Optional[str] = N
     """
     build apk launch command
     """
-    args_string = ''
+    parts: List[str] = ['am', 'start', '-W']
+    if not activity:
+        parts.append(str(package))
+    else:
+        parts.extend(['-n', '{}/{}'.format(package, activity)])
     if apk_args:
         for k, v in apk_args.items():
             if isinstance(v, str):
                 arg = '--es'
-                v = quote(v)
             elif isinstance(v, float):
                 arg = '--ef'
             elif isinstance(v, bool):
@@ -259,12 +308,5 @@ def build_apk_launch_command(package: Optional[str], activity: Optional[str] = N
                 arg = '--ei'
             else:
                 raise ValueError('Unable to encode {} {}'.format(v, type(v)))
-
-            args_string = '{} {} {} {}'.format(args_string, arg, k, v)
-
-    if not activity:
-        cmd = 'am start -W {} {}'.format(package, args_string)
-    else:
-        cmd = 'am start -W -n {}/{} {}'.format(package, activity, args_string)
-
-    return cmd
+            parts.extend([arg, str(k), str(v)])
+    return ' '.join(quote(part) for part in parts)
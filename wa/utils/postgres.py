@@ -29,6 +29,7 @@ http://initd.org/psycopg/docs/extensions.html#sql-adaptation-protocol-objects
 
 import re
 import os
+from functools import wraps
 
 try:
     from psycopg2 import InterfaceError  # type:ignore
@@ -53,25 +54,42 @@ POSTGRES_SCHEMA_DIR: str = os.path.join(os.path.dirname(__file__),
                                         'postgres_schemas')
 
 
+_PSYCOPG2_AVAILABLE: bool = AsIs is not None
+
+_LEVEL_RE = re.compile(r'([^\(\)]*)\((\d+)\)')
+_SCHEMA_HDR = re.compile(r'\A--!VERSION!(\d+)\.(\d+)!ENDVERSION!\n(.*)', re.S)
+
+
+def _requires_psycopg2(func: Callable) -> Callable:
+    """
+    Returns ``func`` unchanged if psycopg2 was imported, or otherwise a
+    function that raises ImportError. This is decided once, when this module
+    is loaded, rather than on every call to an adapter.
+    """
+    if _PSYCOPG2_AVAILABLE:
+        return func
+
+    @wraps(func)
+    def unavailable(*args, **kwargs):
+        raise ImportError('There was a problem importing psycopg2.')
+    return unavailable
+
+
 class Level(Enum):
     LOW = 1
     MEDIUM = 2
     HIGH = 3
 
 
+@_requires_psycopg2
 def cast_level(value: str, cur: Optional['cursor']):  # pylint: disable=unused-argument
     """Generic Level caster for psycopg2"""
-    if InterfaceError is None:
-        raise ImportError('There was a problem importing psycopg2.')
     if value is None:
         return None
 
-    m = re.match(r"([^\()]*)\((\d*)\)", value)
-    name = str(m.group(1)) if m else ''
-    number = int(m.group(2)) if m else 0
-
+    m = _LEVEL_RE.match(value)
     if m:
-        return level(name, number)
+        return level(m.group(1), int(m.group(2)))
     else:
         raise InterfaceError("Bad level representation: {}".format(value))
 
@@ -104,6 +122,7 @@ class ListOfLevel(object):
         return self.value
 
 
+@_requires_psycopg2
 def adapt_ListOfX(adapt_X: Callable):
     """This will create a multi-column adapter for a particular type.
 
@@ -129,38 +148,21 @@ def adapt_ListOfX(adapt_X: Callable):
     1 dimensional array.
     """
     def adapter_function(param: Any) -> AsIs:  # type:ignore
-        if AsIs is None:
-            raise ImportError('There was a problem importing psycopg2.')
         param = param.value
-        result_list: List[str] = []
-        for element in param:  # Where param will be a list of X's
-            result_list.append(adapt_X(element))
-        test_element = result_list[0]
-        num_items: int = len(test_element.split(","))
-        master_list: List[str] = []
-        for x in range(num_items):
-            master_list.append("")
-        for element in result_list:
-            element = element.strip("{").strip("}")
-            element = element.split(",")
-            for x in range(num_items):
-                master_list[x] = master_list[x] + element[x] + ","
-        if num_items > 1:
-            master_sql_string: str = "{"
-        else:
-            master_sql_string = ""
-        for x in range(num_items):
-            # Remove trailing comma
-            master_list[x] = master_list[x].strip(",")
-            master_list[x] = "{" + master_list[x] + "}"
-            master_sql_string = master_sql_string + master_list[x] + ","
-        master_sql_string = master_sql_string.strip(",")
+        # Where param will be a list of X's, each split into its columns
+        rows: List[List[str]] = [adapt_X(element).strip("{").strip("}").split(",")
+                                 for element in param]
+        num_items: int = len(rows[0])
+        master_list = zip(*rows)
+        master_sql_string: str = ",".join("{{{}}}".format(",".join(column))
+                                          for column in master_list)
         if num_items > 1:
-            master_sql_string = master_sql_string + "}"
+            master_sql_string = "{{{}}}".format(master_sql_string)
         return AsIs("'{}'".format(master_sql_string))
     return adapter_function
 
 
+@_requires_psycopg2
 def return_as_is(adapt_X: Callable) -> Callable:
     """Returns the AsIs appended function of the function passed
 
@@ -168,27 +170,23 @@ def return_as_is(adapt_X: Callable) -> Callable:
     adapt_ListOfX function, which must return strings, as it allows them
     to be standalone adapters.
     """
-    if AsIs is None:
-        raise ImportError('There was a problem importing psycopg2.')
-
     def adapter_function(param: Any) -> AsIs:  # type:ignore
-        if AsIs is not None:
-            return AsIs("'{}'".format(adapt_X(param)))
+        return AsIs("'{}'".format(adapt_X(param)))
     return adapter_function
 
 
+@_requires_psycopg2
 def adapt_vanilla(param: Any) -> AsIs:  # type:ignore
     """Vanilla adapter: simply returns the string representation"""
-    if AsIs is None:
-        raise ImportError('There was a problem importing psycopg2.')
     return AsIs("'{}'".format(param))
 
 
+@_requires_psycopg2
 def create_iterable_adapter(array_columns: int, explicit_iterate: bool = False) -> Callable:
     """Create an iterable adapter of a specified dimension
 
     If explicit_iterate is True, then it will be assumed that the param needs
-    to be iterated upon via param.iteritems(). Otherwise it will simply be
+    to be iterated upon via param.items(). Otherwise it will simply be
     iterated vanilla.
     The value of array_columns will be equal to the number of indexed elements
     per item in the param iterable. E.g. a list of 3-element-long lists has
@@ -197,40 +195,26 @@ def create_iterable_adapter(array_columns: int, explicit_iterate: bool = False)
     If array_columns is 0, then this indicates that the iterable contains
     single items.
     """
-    if AsIs is None:
-        raise ImportError('There was a problem importing psycopg2.')
-
     def adapt_iterable(param: Any) -> AsIs:  # type:ignore
         """Adapts an iterable object into an SQL array"""
         final_string: str = ""  # String stores a string representation of the array
         if param:
             if array_columns > 1:
-                for index in range(array_columns):
-                    array_string: str = ""
-                    for item in param.iteritems():
-                        array_string = array_string + str(item[index]) + ","
-                    array_string = array_string.strip(",")
-                    array_string = "{" + array_string + "}"
-                    final_string = final_string + array_string + ","
-                final_string = final_string.strip(",")
+                columns = list(zip(*param.items()))[:array_columns]
+                final_string = ",".join("{{{}}}".format(",".join(map(str, column)))
+                                        for column in columns)
             else:
                 # Simply return each item in the array
-                if explicit_iterate:
-                    for item in param.iteritems():
-                        final_string = final_string + str(item) + ","
-                else:
-                    for item in param:
-                        final_string = final_string + str(item) + ","
-        if AsIs is not None:
-            return AsIs("'{{{}}}'".format(final_string))
+                items = param.items() if explicit_iterate else param
+                final_string = ",".join(map(str, items)) + ","
+        return AsIs("'{{{}}}'".format(final_string))
     return adapt_iterable
 
 
 # For reference only and future use
+@_requires_psycopg2
 def adapt_list(param: Any) -> AsIs:  # type: ignore
     """Adapts a list into an array"""
-    if AsIs is None:
-        raise ImportError('There was a problem importing psycopg2.')
     final_string: str = ""
     if param:
         for item in param:
@@ -246,16 +230,14 @@ def get_schema(schemafilepath: str) -> Tuple[Optional[int], Optional[int], str]:
     with open(schemafilepath, 'r') as sqlfile:
         sql_commands = sqlfile.read()
 
-    schema_major: Optional[str] = None
-    schema_minor: Optional[str] = None
+    schema_major: Optional[int] = None
+    schema_minor: Optional[int] = None
     # Extract schema version if present
-    if sql_commands.startswith('--!VERSION'):
-        splitcommands = sql_commands.split('!ENDVERSION!\n')
-        schema_major, schema_minor = splitcommands[0].strip('--!VERSION!').split('.')
-        schema_major_ = int(schema_major)
-        schema_minor_ = int(schema_minor)
-        sql_commands = splitcommands[1]
-    return schema_major_, schema_minor_, sql_commands
+    m = _SCHEMA_HDR.match(sql_commands)
+    if m:
+        schema_major, schema_minor = int(m.group(1)), int(m.group(2))
+        sql_commands = m.group(3)
+    return schema_major, schema_minor, sql_commands
 
 
 def get_database_schema_version(conn: 'connection') -> Tuple[Optional[int], Optional[int]]:
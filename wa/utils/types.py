@@ -34,7 +34,7 @@ from urllib.parse import quote, unquote  # pylint: disable=no-name-in-module, im
 # pylint: disable=wrong-import-position
 from collections import defaultdict
 from collections.abc import MutableMapping
-from functools import total_ordering
+from functools import total_ordering, lru_cache
 
 from future.utils import with_metaclass  # type:ignore
 
@@ -206,10 +206,13 @@ def regex(value: Union[str, Pattern[str]]) -> Pattern[str]:
         return re.compile(value)
 
 
+@lru_cache(maxsize=256)
 def version_tuple(v: str) -> Tuple[str, ...]:
     """
     Converts a version string into a tuple of strings that can be used for
-    natural comparison allowing delimeters of "-" and ".".
+    natural comparison allowing delimeters of "-" and ".". Results are
+    cached by value, as the same version strings are typically compared
+    repeatedly while resolving resources.
     """
     v = v.replace('-', '.')
     return tuple(map(str, (v.split("."))))
@@ -309,6 +312,10 @@ class prioritylist(object):
         - ``new_element`` the element to be inserted in the prioritylist
         - ``priority`` is the priority of the element which specifies its
         order within the List
+
+        Elements are appended to a per-priority bucket, so adding is cheap
+        (a binary insertion only happens for a previously unseen priority);
+        there is no need to batch additions.
         """
         self._add_element(new_element, priority)
 